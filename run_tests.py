@@ -112,6 +112,7 @@ def main():
         description = "Running unit tests"
     elif args.type == "integration":
         pytest_cmd.extend(["-m", "integration or slow"])
+        os.environ["OPENALEX_RUN_REMOTE"] = "1"
         description = "Running integration tests"
     elif args.type == "coverage":
         pytest_cmd.extend([
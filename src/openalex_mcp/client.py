@@ -1,14 +1,166 @@
 """OpenAlex API client for making HTTP requests to the OpenAlex API."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
-from urllib.parse import urlencode
+import copy
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote_plus, urlencode
 
 import httpx
+import orjson
 
 from .config import config
 from .logutil import logger
 
+# HTTP statuses below 500 that are worth retrying (rate limiting, timeouts)
+RETRYABLE_STATUS_CODES = frozenset({408, 429})
+
+# Chunk size used when streaming PDF downloads to disk
+PDF_CHUNK_SIZE = 64 * 1024
+
+# Process-wide HTTP client shared by every OpenAlexClient so that TCP/TLS
+# connections to api.openalex.org are kept alive across tool calls.
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the shared httpx client, creating it lazily on first use.
+
+    An httpx client is bound to the event loop it was opened on, so a fresh
+    client is created if the running loop has changed, and the old one is
+    closed on its own loop if that loop is still running.
+    """
+    global _shared_client, _shared_client_loop
+
+    loop = asyncio.get_running_loop()
+    if (
+        _shared_client is None
+        or _shared_client.is_closed
+        or _shared_client_loop is not loop
+    ):
+        if _shared_client is not None and not _shared_client.is_closed:
+            _discard_shared_client(_shared_client, _shared_client_loop)
+        # HTTP/2 multiplexes concurrent requests over one connection. With the
+        # brotli extra installed httpx advertises "gzip, deflate, br" itself.
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            timeout=config.timeout,
+            headers={"User-Agent": config.user_agent},
+            # The pool caps concurrency process-wide; excess requests queue
+            # for a free connection.
+            limits=httpx.Limits(
+                max_connections=config.max_concurrent_requests,
+                max_keepalive_connections=config.max_concurrent_requests,
+                keepalive_expiry=300,
+            ),
+        )
+        _shared_client_loop = loop
+    return _shared_client
+
+
+def _discard_shared_client(
+    client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Release a shared client left behind on an event loop that is no longer current.
+
+    The client's connections belong to its own loop and cannot be closed from
+    the new one, so the close is handed to that loop while it is running. A
+    loop that has stopped or closed would never run aclose(), so the client is
+    just dropped; its sockets are released when its transports are garbage
+    collected.
+    """
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+async def aclose_shared() -> None:
+    """Close the shared httpx client. Call once at process shutdown."""
+    global _shared_client, _shared_client_loop
+
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
+
+
+class OpenAlexAPIError(Exception):
+    """Error raised when a request to the OpenAlex API fails.
+
+    Attributes:
+        status_code: HTTP status returned by the API, or None for transport errors
+        retryable: Whether the failure is transient, so a retry may succeed
+    """
+
+    def __init__(
+        self, message: str, status_code: Optional[int] = None, retryable: bool = False
+    ):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+
+
+class ResponseCache:
+    """In-memory LRU cache of API responses whose entries expire after a TTL."""
+
+    def __init__(self, max_size: int, ttl: float):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of responses kept before evicting the oldest
+            ttl: Seconds a cached response stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store a copy of a response, evicting the least recently used entries.
+
+        Args:
+            key: Cache key
+            value: Response to cache
+            ttl: Seconds this entry stays valid, defaulting to the cache's TTL
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+
+# Process-wide response cache shared by every OpenAlexClient
+_response_cache = ResponseCache(config.cache_max_size, config.cache_ttl)
+
+
+def clear_response_cache() -> None:
+    """Drop every cached API response."""
+    _response_cache.clear()
+
 
 class OpenAlexClient:
     """Async client for the OpenAlex API."""
@@ -25,67 +177,191 @@ class OpenAlexClient:
         self.email = email or config.email
         self._timeout = timeout  # Store original value, use property for dynamic config access
         self._client: Optional[httpx.AsyncClient] = None
-        self._rate_limiter = asyncio.Semaphore(config.max_concurrent_requests)
+
+    @property
+    def email(self) -> Optional[str]:
+        """Email address sent as ``mailto`` for polite pool access."""
+        return self._email
+
+    @email.setter
+    def email(self, value: Optional[str]) -> None:
+        self._email = value
+        # Pre-encode the constant mailto parameter once instead of per request
+        self._mailto_query = f"mailto={quote_plus(value)}" if value else ""
 
     @property
     def timeout(self) -> float:
         """Get timeout value, using config if not set explicitly."""
         return self._timeout if self._timeout is not None else config.timeout
 
+    async def start(self) -> None:
+        """Attach the client to the shared httpx client so it can send requests."""
+        self._client = get_shared_client()
+
+    async def stop(self) -> None:
+        """Detach the client from the shared httpx client.
+
+        The shared client itself stays open for other users; ``aclose_shared()``
+        closes it at shutdown.
+        """
+        self._client = None
+
     async def __aenter__(self) -> "OpenAlexClient":
         """Async context manager entry."""
-        headers = {"User-Agent": config.get_user_agent()}
-        self._client = httpx.AsyncClient(timeout=self.timeout, headers=headers)
+        await self.start()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        """Async context manager exit.
+
+        The underlying httpx client is shared, so it is left open here; use
+        ``aclose_shared()`` to close it at shutdown.
+        """
 
     def _build_url(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
         """Build the full URL with query parameters."""
-        url = f"{self.BASE_URL}/{endpoint.lstrip('/')}"
+        query = urlencode(params, doseq=True) if params else ""
+        return self._url_for(endpoint.lstrip("/"), query)
 
-        if params is None:
-            params = {}
+    def _url_for(self, path: str, query: str) -> str:
+        """Join a path and an encoded query, adding the email for polite pool access."""
+        if self._mailto_query:
+            query = f"{query}&{self._mailto_query}" if query else self._mailto_query
 
-        # Add email for polite pool access
-        if self.email:
-            params["mailto"] = self.email
+        url = f"{self.BASE_URL}/{path}"
+        return f"{url}?{query}" if query else url
 
-        if params:
-            url += f"?{urlencode(params, doseq=True)}"
-
-        return url
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        cache_ttl: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Make an async HTTP request to the OpenAlex API.
 
-    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make an async HTTP request to the OpenAlex API."""
+        Args:
+            endpoint: API path relative to the base URL
+            params: Query parameters
+            cache_ttl: Seconds to cache the response, defaulting to
+                ``OPENALEX_CACHE_TTL``
+        """
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
 
-        async with self._rate_limiter:
-            url = self._build_url(endpoint, params)
+        log_requests = config.log_api_requests
+        cache_enabled = config.cache_enabled
+
+        path = endpoint.lstrip("/")
+        query = urlencode(params, doseq=True) if params else ""
 
-            if config.log_api_requests:
-                logger.debug(f"Making request to: {url}")
+        # Key on the caller's params only so the polite-pool email is ignored
+        cache_key = f"{path}?{query}" if query else path
 
+        if cache_enabled:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                if log_requests:
+                    logger.debug("Cache hit for: %s", cache_key)
+                return cached
+
+        url = self._url_for(path, query)
+
+        attempt = 0
+        while True:
             try:
-                response = await self._client.get(url)
-                response.raise_for_status()
+                data = await self._fetch_json(url, log_requests)
+                break
+            except OpenAlexAPIError as e:
+                if not e.retryable or attempt >= config.max_retries:
+                    logger.error("%s", e)
+                    raise
+                delay = config.retry_backoff * 2 ** attempt
+                attempt += 1
+                logger.warning(
+                    "%s - retrying in %.1fs (attempt %d/%d)",
+                    e,
+                    delay,
+                    attempt,
+                    config.max_retries,
+                )
+                await asyncio.sleep(delay)
+
+        if cache_enabled:
+            _response_cache.set(cache_key, data, cache_ttl)
+        return data
+
+    async def _fetch_json(self, url: str, log_requests: bool) -> Dict[str, Any]:
+        """Send a single GET request and decode the JSON body."""
+        client = self._client
+        if client is None:
+            raise RuntimeError("Client not initialized. Use async context manager.")
+
+        if log_requests:
+            logger.debug("Making request to: %s", url)
+
+        try:
+            response = await client.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            raise OpenAlexAPIError(
+                f"OpenAlex API error ({status_code}): {e.response.text}",
+                status_code=status_code,
+                retryable=status_code in RETRYABLE_STATUS_CODES or status_code >= 500,
+            ) from e
+        except httpx.RequestError as e:
+            raise OpenAlexAPIError(f"Request failed: {e}", retryable=True) from e
+
+        if log_requests:
+            logger.debug("Response status: %s", response.status_code)
+
+        return orjson.loads(response.content)
+
+    async def _get_entity(
+        self,
+        endpoint: str,
+        entity_id: Optional[str] = None,
+        search: Optional[str] = None,
+        filter_params: Optional[Dict[str, str]] = None,
+        sort: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 25,
+        select: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get a single entity by ID, or a page of entities from a list endpoint.
 
-                if config.log_api_requests:
-                    logger.debug(f"Response status: {response.status_code}")
+        Args:
+            endpoint: Entity endpoint (works, authors, institutions, sources, topics)
+            entity_id: Specific entity ID to retrieve
+            search: Search query
+            filter_params: Filter parameters
+            sort: Sort order
+            page: Page number
+            per_page: Results per page
+            select: Fields to select
+        """
+        if entity_id:
+            # Entity metadata changes slowly, so single records are kept longer
+            return await self._make_request(
+                f"{endpoint}/{entity_id}", {}, cache_ttl=config.entity_cache_ttl
+            )
+
+        params: Dict[str, Any] = {
+            "page": page,
+            "per_page": min(per_page, 200)  # Max 200 per page
+        }
+        if search:
+            params["search"] = search  # OpenAlex expects 'search' not 'q'
+        if sort:
+            params["sort"] = sort
+        if select:
+            params["select"] = ",".join(select)
+        if filter_params:
+            params["filter"] = ",".join(
+                f"{key}:{value}" for key, value in filter_params.items()
+            )
 
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                error_msg = f"OpenAlex API error ({e.response.status_code}): {e.response.text}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
-            except httpx.RequestError as e:
-                error_msg = f"Request failed: {str(e)}"
-                logger.error(error_msg)
-                raise Exception(error_msg)
+        return await self._make_request(endpoint, params)
 
     async def get_works(
         self,
@@ -95,7 +371,8 @@ class OpenAlexClient:
         sort: Optional[str] = None,
         page: int = 1,
         per_page: int = 25,
-        select: Optional[List[str]] = None
+        select: Optional[List[str]] = None,
+        cites: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get works from OpenAlex.
         
@@ -107,30 +384,71 @@ class OpenAlexClient:
             page: Page number
             per_page: Results per page
             select: Fields to select
+            cites: Only return works that cite this work ID
         """
-        if work_id:
-            endpoint = f"works/{work_id}"
-            params: Dict[str, Any] = {}
-        else:
-            endpoint = "works"
-            params: Dict[str, Any] = {
-                "page": page,
-                "per_page": min(per_page, 200)  # Max 200 per page
-            }
-            if search:
-                params["search"] = search  # OpenAlex expects 'search' not 'q' for /works
-            if sort:
-                params["sort"] = sort
-            if select:
-                params["select"] = ",".join(select)
-            if filter_params:
-                filters = []
-                for key, value in filter_params.items():
-                    filters.append(f"{key}:{value}")
-                if filters:
-                    params["filter"] = ",".join(filters)
+        if cites:
+            filter_params = {**(filter_params or {}), "cites": cites}
+
+        return await self._get_entity(
+            "works",
+            work_id,
+            search=search,
+            filter_params=filter_params,
+            sort=sort,
+            page=page,
+            per_page=per_page,
+            select=select,
+        )
+
+    async def get_works_paginated(
+        self,
+        *,
+        search: Optional[str] = None,
+        filter_params: Optional[Dict[str, str]] = None,
+        sort: Optional[str] = None,
+        per_page: int = 200,
+        max_results: int = 1000,
+        select: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch several pages of works concurrently.
 
-        return await self._make_request(endpoint, params)
+        Every page needed to cover ``max_results`` is requested at once; the
+        shared connection pool bounds how many are in flight.
+
+        Args:
+            search: Search query
+            filter_params: Filter parameters
+            sort: Sort order
+            per_page: Results per page (max 200)
+            max_results: Number of results to cover
+            select: Fields to select
+
+        Returns:
+            The page responses, in page order
+
+        Raises:
+            ValueError: If per_page or max_results is not positive
+        """
+        if per_page <= 0:
+            raise ValueError("per_page must be positive")
+
+        if max_results <= 0:
+            raise ValueError("max_results must be positive")
+
+        per_page = min(per_page, 200)
+        num_pages = math.ceil(max_results / per_page)
+
+        return list(await asyncio.gather(*(
+            self.get_works(
+                search=search,
+                filter_params=filter_params,
+                sort=sort,
+                page=page,
+                per_page=per_page,
+                select=select,
+            )
+            for page in range(1, num_pages + 1)
+        )))
 
     async def get_authors(
         self,
@@ -143,29 +461,16 @@ class OpenAlexClient:
         select: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Get authors from OpenAlex."""
-        if author_id:
-            endpoint = f"authors/{author_id}"
-            params: Dict[str, Any] = {}
-        else:
-            endpoint = "authors"
-            params: Dict[str, Any] = {
-                "page": page,
-                "per_page": min(per_page, 200)
-            }
-            if search:
-                params["search"] = search
-            if sort:
-                params["sort"] = sort
-            if select:
-                params["select"] = ",".join(select)
-            if filter_params:
-                filters = []
-                for key, value in filter_params.items():
-                    filters.append(f"{key}:{value}")
-                if filters:
-                    params["filter"] = ",".join(filters)
-
-        return await self._make_request(endpoint, params)
+        return await self._get_entity(
+            "authors",
+            author_id,
+            search=search,
+            filter_params=filter_params,
+            sort=sort,
+            page=page,
+            per_page=per_page,
+            select=select,
+        )
 
     async def get_institutions(
         self,
@@ -178,29 +483,16 @@ class OpenAlexClient:
         select: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Get institutions from OpenAlex."""
-        if institution_id:
-            endpoint = f"institutions/{institution_id}"
-            params: Dict[str, Any] = {}
-        else:
-            endpoint = "institutions"
-            params: Dict[str, Any] = {
-                "page": page,
-                "per_page": min(per_page, 200)
-            }
-            if search:
-                params["search"] = search
-            if sort:
-                params["sort"] = sort
-            if select:
-                params["select"] = ",".join(select)
-            if filter_params:
-                filters = []
-                for key, value in filter_params.items():
-                    filters.append(f"{key}:{value}")
-                if filters:
-                    params["filter"] = ",".join(filters)
-
-        return await self._make_request(endpoint, params)
+        return await self._get_entity(
+            "institutions",
+            institution_id,
+            search=search,
+            filter_params=filter_params,
+            sort=sort,
+            page=page,
+            per_page=per_page,
+            select=select,
+        )
 
     async def get_sources(
         self,
@@ -213,29 +505,16 @@ class OpenAlexClient:
         select: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Get sources from OpenAlex."""
-        if source_id:
-            endpoint = f"sources/{source_id}"
-            params: Dict[str, Any] = {}
-        else:
-            endpoint = "sources"
-            params: Dict[str, Any] = {
-                "page": page,
-                "per_page": min(per_page, 200)
-            }
-            if search:
-                params["search"] = search
-            if sort:
-                params["sort"] = sort
-            if select:
-                params["select"] = ",".join(select)
-            if filter_params:
-                filters = []
-                for key, value in filter_params.items():
-                    filters.append(f"{key}:{value}")
-                if filters:
-                    params["filter"] = ",".join(filters)
-
-        return await self._make_request(endpoint, params)
+        return await self._get_entity(
+            "sources",
+            source_id,
+            search=search,
+            filter_params=filter_params,
+            sort=sort,
+            page=page,
+            per_page=per_page,
+            select=select,
+        )
 
     async def get_topics(
         self,
@@ -248,31 +527,18 @@ class OpenAlexClient:
         select: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Get topics from OpenAlex."""
-        if topic_id:
-            endpoint = f"topics/{topic_id}"
-            params: Dict[str, Any] = {}
-        else:
-            endpoint = "topics"
-            params: Dict[str, Any] = {
-                "page": page,
-                "per_page": min(per_page, 200)
-            }
-            if search:
-                params["search"] = search
-            if sort:
-                params["sort"] = sort
-            if select:
-                params["select"] = ",".join(select)
-            if filter_params:
-                filters = []
-                for key, value in filter_params.items():
-                    filters.append(f"{key}:{value}")
-                if filters:
-                    params["filter"] = ",".join(filters)
-
-        return await self._make_request(endpoint, params)
-
-    async def download_pdf(self, pdf_url: str, file_path: str) -> bool:
+        return await self._get_entity(
+            "topics",
+            topic_id,
+            search=search,
+            filter_params=filter_params,
+            sort=sort,
+            page=page,
+            per_page=per_page,
+            select=select,
+        )
+
+    async def download_pdf(self, pdf_url: str, file_path: str) -> Optional[int]:
         """Download a PDF from a given URL.
         
         Args:
@@ -280,41 +546,57 @@ class OpenAlexClient:
             file_path: Local path where to save the PDF
             
         Returns:
-            True if download was successful, False otherwise
+            Number of bytes written if the download was successful, None otherwise
         """
         if not self._client:
             raise RuntimeError("Client not initialized. Use async context manager.")
 
-        try:
-            async with self._rate_limiter:
-                if config.log_api_requests:
-                    logger.debug(f"Downloading PDF from: {pdf_url}")
+        log_requests = config.log_api_requests
 
-                response = await self._client.get(pdf_url, follow_redirects=True)
+        try:
+            if log_requests:
+                logger.debug("Downloading PDF from: %s", pdf_url)
+
+            async with self._client.stream(
+                "GET", pdf_url, follow_redirects=True, timeout=self.timeout
+            ) as response:
+                if not response.is_success:
+                    await response.aread()  # Load the body for the error message
                 response.raise_for_status()
 
                 # Check if response contains PDF content
                 content_type = response.headers.get("content-type", "").lower()
                 if "pdf" not in content_type:
-                    logger.warning(f"Downloaded content may not be PDF: {content_type}")
-
-                with open(file_path, "wb") as f:
-                    f.write(response.content)
-
-                if config.log_api_requests:
-                    logger.debug(f"PDF saved to: {file_path}")
-
-                return True
+                    logger.warning(
+                        "Downloaded content may not be PDF: %s", content_type
+                    )
+
+                # Write chunk by chunk in a worker thread so memory stays bounded
+                # and disk I/O does not block the event loop
+                size = 0
+                f = await asyncio.to_thread(open, file_path, "wb")
+                try:
+                    async for chunk in response.aiter_bytes(PDF_CHUNK_SIZE):
+                        size += await asyncio.to_thread(f.write, chunk)
+                except BaseException:
+                    f.close()
+                    os.remove(file_path)  # Don't leave a truncated PDF behind
+                    raise
+                await asyncio.to_thread(f.close)
+
+            if log_requests:
+                logger.debug("PDF saved to: %s", file_path)
+
+            return size
 
         except httpx.HTTPStatusError as e:
-            error_msg = f"PDF download failed ({e.response.status_code}): {e.response.text}"
-            logger.error(error_msg)
-            return False
+            logger.error(
+                "PDF download failed (%s): %s", e.response.status_code, e.response.text
+            )
+            return None
         except httpx.RequestError as e:
-            error_msg = f"PDF download request failed: {str(e)}"
-            logger.error(error_msg)
-            return False
+            logger.error("PDF download request failed: %s", e)
+            return None
         except OSError as e:
-            error_msg = f"Failed to save PDF file: {str(e)}"
-            logger.error(error_msg)
-            return False
+            logger.error("Failed to save PDF file: %s", e)
+            return None
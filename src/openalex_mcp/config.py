@@ -12,16 +12,31 @@ class OpenAlexConfig:
         self.email: Optional[str] = os.getenv("OPENALEX_EMAIL")
         self.timeout: float = float(os.getenv("OPENALEX_TIMEOUT", "30.0"))
         self.max_concurrent_requests: int = int(os.getenv("OPENALEX_MAX_CONCURRENT", "10"))
+        self.max_retries: int = int(os.getenv("OPENALEX_MAX_RETRIES", "2"))
+        self.retry_backoff: float = float(os.getenv("OPENALEX_RETRY_BACKOFF", "0.5"))
         self.default_page_size: int = int(os.getenv("OPENALEX_DEFAULT_PAGE_SIZE", "25"))
         self.max_page_size: int = int(os.getenv("OPENALEX_MAX_PAGE_SIZE", "200"))
 
         # Rate limiting
         self.daily_request_limit: int = int(os.getenv("OPENALEX_DAILY_LIMIT", "100000"))
 
+        # Response caching
+        self.cache_enabled: bool = (
+            os.getenv("OPENALEX_CACHE_ENABLED", "true").lower() == "true"
+        )
+        self.cache_ttl: float = float(os.getenv("OPENALEX_CACHE_TTL", "600"))
+        self.entity_cache_ttl: float = float(
+            os.getenv("OPENALEX_ENTITY_CACHE_TTL", "3600")
+        )
+        self.cache_max_size: int = int(os.getenv("OPENALEX_CACHE_MAX_SIZE", "2048"))
+
         # Logging
         self.log_level: str = os.getenv("LOG_LEVEL", "INFO")
         self.log_api_requests: bool = os.getenv("LOG_API_REQUESTS", "false").lower() == "true"
 
+        # Computed once; the email does not change after startup
+        self.user_agent: str = self.get_user_agent()
+
     def validate(self) -> None:
         """Validate configuration."""
         if self.timeout <= 0:
@@ -30,12 +45,27 @@ class OpenAlexConfig:
         if self.max_concurrent_requests <= 0:
             raise ValueError("OPENALEX_MAX_CONCURRENT must be positive")
 
+        if self.max_retries < 0:
+            raise ValueError("OPENALEX_MAX_RETRIES must not be negative")
+
+        if self.retry_backoff < 0:
+            raise ValueError("OPENALEX_RETRY_BACKOFF must not be negative")
+
         if self.default_page_size <= 0 or self.default_page_size > self.max_page_size:
             raise ValueError(f"OPENALEX_DEFAULT_PAGE_SIZE must be between 1 and {self.max_page_size}")
 
         if self.daily_request_limit <= 0:
             raise ValueError("OPENALEX_DAILY_LIMIT must be positive")
 
+        if self.cache_ttl <= 0:
+            raise ValueError("OPENALEX_CACHE_TTL must be positive")
+
+        if self.entity_cache_ttl <= 0:
+            raise ValueError("OPENALEX_ENTITY_CACHE_TTL must be positive")
+
+        if self.cache_max_size <= 0:
+            raise ValueError("OPENALEX_CACHE_MAX_SIZE must be positive")
+
     def get_user_agent(self) -> str:
         """Get user agent string for API requests."""
         base = "OpenAlexMCP/0.1.0"
@@ -37,4 +37,8 @@ def setup_logging(logger_name: Optional[str] = None) -> logging.Logger:
 
     return logger
 
-logger = setup_logging()
+
+# Handlers are attached by calling setup_logging() from the entry point, so
+# importing the package does not configure logging as a side effect.
+logger = logging.getLogger("openalex_mcp")
+
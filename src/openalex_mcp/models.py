@@ -2,17 +2,26 @@
 
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class AuthorInfo(BaseModel):
+class OpenAlexModel(BaseModel):
+    """Base model for OpenAlex entities.
+
+    Models are immutable and ignore unknown fields, since the API adds fields
+    over time and parsed results are never modified.
+    """
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class AuthorInfo(OpenAlexModel):
     """Author information."""
     id: Optional[str] = None
     display_name: Optional[str] = None
     orcid: Optional[str] = None
 
 
-class Institution(BaseModel):
+class Institution(OpenAlexModel):
     """Institution information."""
     id: Optional[str] = None
     display_name: Optional[str] = None
@@ -21,7 +30,7 @@ class Institution(BaseModel):
     type: Optional[str] = None
 
 
-class Authorship(BaseModel):
+class Authorship(OpenAlexModel):
     """Authorship information for a work."""
     author_position: Optional[str] = None
     author: Optional[AuthorInfo] = None
@@ -30,7 +39,7 @@ class Authorship(BaseModel):
     is_corresponding: Optional[bool] = None
 
 
-class Source(BaseModel):
+class Source(OpenAlexModel):
     """Source/venue information."""
     id: Optional[str] = None
     display_name: Optional[str] = None
@@ -42,7 +51,7 @@ class Source(BaseModel):
     host_organization: Optional[str] = None
 
 
-class Location(BaseModel):
+class Location(OpenAlexModel):
     """Location information for a work."""
     source: Optional[Source] = None
     landing_page_url: Optional[str] = None
@@ -52,7 +61,7 @@ class Location(BaseModel):
     license: Optional[str] = None
 
 
-class Topic(BaseModel):
+class Topic(OpenAlexModel):
     """Topic information."""
     id: Optional[str] = None
     display_name: Optional[str] = None
@@ -62,7 +71,7 @@ class Topic(BaseModel):
     domain: Optional[Dict[str, Any]] = None
 
 
-class Work(BaseModel):
+class Work(OpenAlexModel):
     """OpenAlex work (publication) model."""
     id: str
     doi: Optional[str] = None
@@ -83,12 +92,13 @@ class Work(BaseModel):
 
     # Topics and concepts
     topics: List[Topic] = Field(default_factory=list)
-    keywords: List[Dict[str, Any]] = Field(default_factory=list)
+    keywords: List[Any] = Field(default_factory=list)  # Passed through unvalidated
 
     # Citation metrics
     cited_by_count: Optional[int] = None
     citation_normalized_percentile: Optional[float] = None
-    counts_by_year: List[Dict[str, Any]] = Field(default_factory=list)
+    # Passed through unvalidated
+    counts_by_year: List[Any] = Field(default_factory=list)
 
     # References
     referenced_works: List[str] = Field(default_factory=list)
@@ -105,7 +115,7 @@ class Work(BaseModel):
     updated_date: Optional[str] = None
 
 
-class Author(BaseModel):
+class Author(OpenAlexModel):
     """OpenAlex author model."""
     id: str
     orcid: Optional[str] = None
@@ -137,7 +147,7 @@ class Author(BaseModel):
     updated_date: Optional[str] = None
 
 
-class InstitutionModel(BaseModel):
+class InstitutionModel(OpenAlexModel):
     """OpenAlex institution model."""
     id: str
     ror: Optional[str] = None
@@ -174,7 +184,7 @@ class InstitutionModel(BaseModel):
     updated_date: Optional[str] = None
 
 
-class SourceModel(BaseModel):
+class SourceModel(OpenAlexModel):
     """OpenAlex source model."""
     id: str
     issn_l: Optional[str] = None
@@ -210,7 +220,7 @@ class SourceModel(BaseModel):
     updated_date: Optional[str] = None
 
 
-class TopicModel(BaseModel):
+class TopicModel(OpenAlexModel):
     """OpenAlex topic model."""
     id: str
     display_name: Optional[str] = None
@@ -238,7 +248,7 @@ class TopicModel(BaseModel):
     updated_date: Optional[str] = None
 
 
-class SearchResponse(BaseModel):
+class SearchResponse(OpenAlexModel):
     """Generic search response model."""
     meta: Dict[str, Any]
     results: List[Dict[str, Any]]
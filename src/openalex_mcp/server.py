@@ -1,10 +1,18 @@
 """OpenAlex MCP Server - Main server implementation using FastMCP."""
 
-import os
-
+import asyncio
+import importlib.util
+import sys
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import anyio
+import orjson
 from mcp.server.fastmcp import FastMCP
+from pydantic import ValidationError, validate_call
 
-from openalex_mcp.client import OpenAlexClient
+from openalex_mcp.client import OpenAlexClient, aclose_shared
+from openalex_mcp.logutil import setup_logging
 from openalex_mcp.tools import (
     download_paper,
     get_author_profile,
@@ -16,10 +24,66 @@ from openalex_mcp.tools import (
     search_works,
 )
 
+# Client shared by every tool call for the lifetime of the server
+_client: Optional[OpenAlexClient] = None
+
+
+async def _get_client() -> OpenAlexClient:
+    """Get the shared OpenAlex client.
+
+    The server lifespan starts it up front; tools called outside a running
+    server create it on first use. It is re-attached to the shared httpx
+    client on every call, so a new event loop (a second server run, or tests)
+    never reuses connections bound to a loop that has gone away.
+    """
+    global _client
+
+    if _client is None:
+        # Falls back to OPENALEX_EMAIL, read once by the config at import
+        _client = OpenAlexClient()
+    await _client.start()
+    return _client
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Start the shared client with the server and close its connection pool on exit."""
+    global _client
+
+    await _get_client()
+    try:
+        yield
+    finally:
+        if _client is not None:
+            await _client.stop()
+            _client = None
+        await aclose_shared()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("openalex-mcp")
+mcp = FastMCP("openalex-mcp", lifespan=lifespan)
 
-email = os.getenv("OPENALEX_EMAIL")
+
+# Tool calls currently running, keyed by tool and arguments
+_inflight: Dict[Tuple[Any, ...], "asyncio.Future[str]"] = {}
+
+
+async def _run_tool(tool: Callable[..., Awaitable[str]], **arguments: Any) -> str:
+    """Call a tool function with the shared client.
+
+    Concurrent calls with identical arguments share a single execution.
+    """
+    client = await _get_client()
+
+    key = (tool, tuple(sorted(arguments.items())))
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(tool(client, **arguments))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # Shielded so one caller being cancelled does not cancel the others
+    return await asyncio.shield(future)
 
 
 @mcp.tool(name="OpenAlex_search_works")
@@ -35,24 +99,18 @@ async def OpenAlex_search_works(
     limit: int = 10
 ) -> str:
     """Search for scholarly works (papers, articles, books) in OpenAlex."""
-    client = OpenAlexClient(email=email)
-    arguments = {
-        "query": query,
-        "author": author,
-        "year_from": year_from,
-        "year_to": year_to,
-        "venue": venue,
-        "topic": topic,
-        "open_access": open_access,
-        "sort": sort,
-        "limit": limit
-    }
-    # Remove None values
-    arguments = {k: v for k, v in arguments.items() if v is not None}
-
-    async with client:
-        result = await search_works(client, arguments)
-        return result[0].text if result else "No results found"
+    return await _run_tool(
+        search_works,
+        query=query,
+        author=author,
+        year_from=year_from,
+        year_to=year_to,
+        venue=venue,
+        topic=topic,
+        open_access=open_access,
+        sort=sort,
+        limit=limit,
+    )
 
 
 @mcp.tool(name="OpenAlex_search_authors")
@@ -66,22 +124,16 @@ async def OpenAlex_search_authors(
     limit: int = 10
 ) -> str:
     """Search for authors/researchers in OpenAlex."""
-    client = OpenAlexClient(email=email)
-    arguments = {
-        "query": query,
-        "institution": institution,
-        "topic": topic,
-        "h_index_min": h_index_min,
-        "works_count_min": works_count_min,
-        "sort": sort,
-        "limit": limit
-    }
-    # Remove None values
-    arguments = {k: v for k, v in arguments.items() if v is not None}
-
-    async with client:
-        result = await search_authors(client, arguments)
-        return result[0].text if result else "No results found"
+    return await _run_tool(
+        search_authors,
+        query=query,
+        institution=institution,
+        topic=topic,
+        h_index_min=h_index_min,
+        works_count_min=works_count_min,
+        sort=sort,
+        limit=limit,
+    )
 
 
 @mcp.tool(name="OpenAlex_search_institutions")
@@ -94,21 +146,15 @@ async def OpenAlex_search_institutions(
     limit: int = 10
 ) -> str:
     """Search for academic institutions in OpenAlex."""
-    client = OpenAlexClient(email=email)
-    arguments = {
-        "query": query,
-        "country": country,
-        "type": institution_type,
-        "works_count_min": works_count_min,
-        "sort": sort,
-        "limit": limit
-    }
-    # Remove None values
-    arguments = {k: v for k, v in arguments.items() if v is not None}
-
-    async with client:
-        result = await search_institutions(client, arguments)
-        return result[0].text if result else "No results found"
+    return await _run_tool(
+        search_institutions,
+        query=query,
+        country=country,
+        institution_type=institution_type,
+        works_count_min=works_count_min,
+        sort=sort,
+        limit=limit,
+    )
 
 
 @mcp.tool(name="OpenAlex_search_sources")
@@ -122,44 +168,28 @@ async def OpenAlex_search_sources(
     limit: int = 10
 ) -> str:
     """Search for journals, conferences, and other publication venues in OpenAlex."""
-    client = OpenAlexClient(email=email)
-    arguments = {
-        "query": query,
-        "type": source_type,
-        "publisher": publisher,
-        "open_access": open_access,
-        "works_count_min": works_count_min,
-        "sort": sort,
-        "limit": limit
-    }
-    # Remove None values
-    arguments = {k: v for k, v in arguments.items() if v is not None}
-
-    async with client:
-        result = await search_sources(client, arguments)
-        return result[0].text if result else "No results found"
+    return await _run_tool(
+        search_sources,
+        query=query,
+        source_type=source_type,
+        publisher=publisher,
+        open_access=open_access,
+        works_count_min=works_count_min,
+        sort=sort,
+        limit=limit,
+    )
 
 
 @mcp.tool(name="OpenAlex_get_work_details")
 async def OpenAlex_get_work_details(work_id: str) -> str:
     """Get detailed information about a specific work by its OpenAlex ID or DOI."""
-    client = OpenAlexClient(email=email)
-    arguments = {"work_id": work_id}
-
-    async with client:
-        result = await get_work_details(client, arguments)
-        return result[0].text if result else "Work not found"
+    return await _run_tool(get_work_details, work_id=work_id)
 
 
 @mcp.tool(name="OpenAlex_get_author_profile")
 async def OpenAlex_get_author_profile(author_id: str) -> str:
     """Get detailed profile information about a specific author by their OpenAlex ID or ORCID."""
-    client = OpenAlexClient(email=email)
-    arguments = {"author_id": author_id}
-
-    async with client:
-        result = await get_author_profile(client, arguments)
-        return result[0].text if result else "Author not found"
+    return await _run_tool(get_author_profile, author_id=author_id)
 
 
 @mcp.tool(name="OpenAlex_get_citations")
@@ -169,16 +199,7 @@ async def OpenAlex_get_citations(
     limit: int = 20
 ) -> str:
     """Get works that cite a specific work, useful for citation analysis."""
-    client = OpenAlexClient(email=email)
-    arguments = {
-        "work_id": work_id,
-        "sort": sort,
-        "limit": limit
-    }
-
-    async with client:
-        result = await get_citations(client, arguments)
-        return result[0].text if result else "No citations found"
+    return await _run_tool(get_citations, work_id=work_id, sort=sort, limit=limit)
 
 
 @mcp.tool(name="OpenAlex_download_paper")
@@ -188,23 +209,103 @@ async def OpenAlex_download_paper(
     filename: str = None
 ) -> str:
     """Download a paper's PDF if available through open access."""
-    client = OpenAlexClient(email=email)
-    arguments = {
-        "work_id": work_id,
-        "output_path": output_path,
-        "filename": filename
-    }
-    # Remove None values
-    arguments = {k: v for k, v in arguments.items() if v is not None}
-
-    async with client:
-        result = await download_paper(client, arguments)
-        return result[0].text if result else "Download failed"
+    return await _run_tool(
+        download_paper,
+        work_id=work_id,
+        output_path=output_path,
+        filename=filename,
+    )
+
+
+# Tools callable from OpenAlex_batch_search; downloads write files and are excluded.
+# Each is wrapped to validate its arguments against the tool's signature, as
+# FastMCP does for a direct call, since batch queries bypass that validation.
+_BATCH_TOOLS: Dict[str, Callable[..., Awaitable[str]]] = {
+    name: validate_call(tool)
+    for name, tool in {
+        "OpenAlex_search_works": OpenAlex_search_works,
+        "OpenAlex_search_authors": OpenAlex_search_authors,
+        "OpenAlex_search_institutions": OpenAlex_search_institutions,
+        "OpenAlex_search_sources": OpenAlex_search_sources,
+        "OpenAlex_get_work_details": OpenAlex_get_work_details,
+        "OpenAlex_get_author_profile": OpenAlex_get_author_profile,
+        "OpenAlex_get_citations": OpenAlex_get_citations,
+    }.items()
+}
+
+# Most queries one OpenAlex_batch_search call may run
+_MAX_BATCH_QUERIES = 50
+
+
+async def _run_batch_query(query: Dict[str, Any]) -> str:
+    """Run one query of a batch through the tool it names."""
+    arguments = dict(query)
+    if "tool" not in arguments:
+        raise ValueError('Query has no "tool" key')
+
+    name = arguments.pop("tool")
+    if name not in _BATCH_TOOLS:
+        raise ValueError(f"Unknown tool: {name}")
+
+    try:
+        return await _BATCH_TOOLS[name](**arguments)
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors()
+        )
+        raise ValueError(f"Invalid arguments for {name}: {problems}") from e
+
+
+@mcp.tool(name="OpenAlex_batch_search")
+async def OpenAlex_batch_search(queries: List[Dict[str, Any]]) -> str:  # noqa: N802
+    """Run several read-only OpenAlex tool calls concurrently.
+
+    Each query is an object with a "tool" key naming one of the OpenAlex_search_*,
+    OpenAlex_get_work_details, OpenAlex_get_author_profile or OpenAlex_get_citations
+    tools, plus that tool's arguments. Returns a JSON list with a "result" or
+    "error" for each query, in order. At most 50 queries may be sent at once.
+    """
+    if len(queries) > _MAX_BATCH_QUERIES:
+        return (
+            f"Error running batch search: at most {_MAX_BATCH_QUERIES} queries "
+            f"are allowed, got {len(queries)}"
+        )
+
+    # Identical queries are only sent once
+    keys = [
+        orjson.dumps(query, option=orjson.OPT_SORT_KEYS, default=str)
+        for query in queries
+    ]
+    unique: Dict[bytes, Dict[str, Any]] = dict(zip(keys, queries))
+
+    outcomes = await asyncio.gather(
+        *(_run_batch_query(query) for query in unique.values()),
+        return_exceptions=True,
+    )
+    by_key = dict(zip(unique, outcomes))
+
+    results = []
+    for query, key in zip(queries, keys):
+        outcome = by_key[key]
+        entry: Dict[str, Any] = {"tool": query.get("tool")}
+        if isinstance(outcome, BaseException):
+            entry["error"] = str(outcome)
+        else:
+            entry["result"] = outcome
+        results.append(entry)
+
+    return orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
 
 
 def main():
     """Run the MCP server."""
-    mcp.run(transport="stdio")
+    setup_logging()
+    # Equivalent to mcp.run(transport="stdio"), but on uvloop when installed
+    use_uvloop = (
+        sys.platform != "win32" and importlib.util.find_spec("uvloop") is not None
+    )
+    anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": use_uvloop})
 
 
 if __name__ == "__main__":
@@ -1,52 +1,57 @@
 """MCP tools for OpenAlex API interactions."""
 
+import asyncio
+import heapq
 import os
-import re
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Dict, Optional
 
-from mcp.types import TextContent, Tool
+from mcp.types import Tool
 
 from openalex_mcp.client import OpenAlexClient
 
+# Characters that are not allowed in filenames on common filesystems
+_FILENAME_UNSAFE_CHARS = str.maketrans("", "", '<>:"/\\|?*')
+
 
 def format_work_summary(work: Dict[str, Any]) -> str:
     """Format a work into a readable summary."""
-    title = work.get("title") or work.get("display_name", "Unknown Title")
-    authors = []
-
-    for authorship in work.get("authorships", []):
-        if author := authorship.get("author"):
-            if name := author.get("display_name"):
-                authors.append(name)
+    # Called once per result row, so the bound lookup is reused throughout
+    get = work.get
 
-    authors_str = ", ".join(authors[:5])  # Limit to first 5 authors
-    if len(work.get("authorships", [])) > 5:
-        authors_str += " et al."
+    title = get("title") or get("display_name", "Unknown Title")
+    authorships = get("authorships", [])
+    # First 5 author names; stops early on papers with very long author lists
+    authors = list(islice((
+        name
+        for authorship in authorships
+        if (author := authorship.get("author")) and (name := author.get("display_name"))
+    ), 5))
 
-    year = work.get("publication_year", "Unknown")
-    citations = work.get("cited_by_count", 0)
+    year = get("publication_year", "Unknown")
+    citations = get("cited_by_count", 0)
 
     # Get venue/source
     venue = "Unknown Venue"
-    if primary_location := work.get("primary_location"):
+    if primary_location := get("primary_location"):
         if source := primary_location.get("source"):
             venue = source.get("display_name", venue)
 
-    # Get topics
-    topics = []
-    for topic in work.get("topics", [])[:3]:  # First 3 topics
-        if topic_name := topic.get("display_name"):
-            topics.append(topic_name)
-
-    topics_str = ", ".join(topics) if topics else "No topics"
+    # First 3 topics
+    topics = ", ".join(
+        filter(
+            None,
+            (topic.get("display_name") for topic in islice(get("topics") or (), 3)),
+        )
+    )
 
     return (
         f"**{title}**\n"
-        f"Authors: {authors_str}\n"
+        f"Authors: {', '.join(authors)}{' et al.' if len(authorships) > 5 else ''}\n"
         f"Year: {year} | Citations: {citations}\n"
         f"Venue: {venue}\n"
-        f"Topics: {topics_str}\n"
-        f"OpenAlex ID: {work.get('id', 'N/A')}\n"
+        f"Topics: {topics or 'No topics'}\n"
+        f"OpenAlex ID: {get('id', 'N/A')}\n"
     )
 
 
@@ -63,20 +68,23 @@ def format_author_summary(author: Dict[str, Any]) -> str:
     if last_inst := author.get("last_known_institution"):
         institution = last_inst.get("display_name", institution)
 
-    # Topics
-    topics = []
-    for topic in author.get("topics", [])[:3]:  # First 3 topics
-        if topic_name := topic.get("display_name"):
-            topics.append(topic_name)
-
-    topics_str = ", ".join(topics) if topics else "No topics"
+    # First 3 topics
+    topics = ", ".join(
+        filter(
+            None,
+            (
+                topic.get("display_name")
+                for topic in islice(author.get("topics") or (), 3)
+            ),
+        )
+    )
 
     return (
         f"**{name}**\n"
         f"ORCID: {orcid}\n"
         f"Institution: {institution}\n"
         f"Works: {works_count} | Citations: {citations} | h-index: {h_index}\n"
-        f"Research areas: {topics_str}\n"
+        f"Research areas: {topics or 'No topics'}\n"
         f"OpenAlex ID: {author.get('id', 'N/A')}\n"
     )
 
@@ -110,11 +118,7 @@ def format_source_summary(source: Dict[str, Any]) -> str:
     works_count = source.get("works_count", 0)
     citations = source.get("cited_by_count", 0)
     h_index = source.get("h_index", 0)
-
-    # Publisher
-    publisher = "Unknown Publisher"
-    if host_org := source.get("host_organization_name"):
-        publisher = host_org
+    publisher = source.get("host_organization_name") or "Unknown Publisher"
 
     return (
         f"**{name}**\n"
@@ -125,6 +129,20 @@ def format_source_summary(source: Dict[str, Any]) -> str:
     )
 
 
+# Property schemas shared by several tool definitions
+_LIMIT_SCHEMA = {
+    "type": "integer",
+    "minimum": 1,
+    "maximum": 50,
+    "default": 10,
+    "description": "Number of results to return (max 50)"
+}
+
+_WORKS_COUNT_MIN_SCHEMA = {
+    "type": "integer",
+    "description": "Minimum number of works"
+}
+
 # Tool definitions
 SEARCH_WORKS_TOOL = Tool(
     name="OpenAlex_search_works",
@@ -165,13 +183,7 @@ SEARCH_WORKS_TOOL = Tool(
                 "enum": ["publication_date", "relevance_score"],
                 "description": "Sort order for results (default: relevance)"
             },
-            "limit": {
-                "type": "integer",
-                "minimum": 1,
-                "maximum": 50,
-                "default": 10,
-                "description": "Number of results to return (max 50)"
-            }
+            "limit": _LIMIT_SCHEMA
         },
         "required": ["query"]
     }
@@ -199,22 +211,13 @@ SEARCH_AUTHORS_TOOL = Tool(
                 "type": "integer",
                 "description": "Minimum h-index"
             },
-            "works_count_min": {
-                "type": "integer",
-                "description": "Minimum number of works"
-            },
+            "works_count_min": _WORKS_COUNT_MIN_SCHEMA,
             "sort": {
                 "type": "string",
                 "enum": ["relevance_score", "cited_by_count", "works_count", "h_index"],
                 "description": "Sort order for results"
             },
-            "limit": {
-                "type": "integer",
-                "minimum": 1,
-                "maximum": 50,
-                "default": 10,
-                "description": "Number of results to return (max 50)"
-            }
+            "limit": _LIMIT_SCHEMA
         },
         "required": ["query"]
     }
@@ -234,27 +237,18 @@ SEARCH_INSTITUTIONS_TOOL = Tool(
                 "type": "string",
                 "description": "Filter by country code (e.g., 'US', 'GB', 'CA')"
             },
-            "type": {
+            "institution_type": {
                 "type": "string",
                 "enum": ["education", "healthcare", "company", "archive", "nonprofit", "government", "facility", "other"],
                 "description": "Filter by institution type"
             },
-            "works_count_min": {
-                "type": "integer",
-                "description": "Minimum number of works"
-            },
+            "works_count_min": _WORKS_COUNT_MIN_SCHEMA,
             "sort": {
                 "type": "string",
                 "enum": ["relevance_score", "cited_by_count", "works_count"],
                 "description": "Sort order for results"
             },
-            "limit": {
-                "type": "integer",
-                "minimum": 1,
-                "maximum": 50,
-                "default": 10,
-                "description": "Number of results to return (max 50)"
-            }
+            "limit": _LIMIT_SCHEMA
         },
         "required": ["query"]
     }
@@ -270,7 +264,7 @@ SEARCH_SOURCES_TOOL = Tool(
                 "type": "string",
                 "description": "Search query for source names"
             },
-            "type": {
+            "source_type": {
                 "type": "string",
                 "enum": ["journal", "conference", "repository", "book-series", "other"],
                 "description": "Filter by source type"
@@ -292,13 +286,7 @@ SEARCH_SOURCES_TOOL = Tool(
                 "enum": ["relevance_score", "cited_by_count", "works_count", "h_index"],
                 "description": "Sort order for results"
             },
-            "limit": {
-                "type": "integer",
-                "minimum": 1,
-                "maximum": 50,
-                "default": 10,
-                "description": "Number of results to return (max 50)"
-            }
+            "limit": _LIMIT_SCHEMA
         },
         "required": ["query"]
     }
@@ -385,49 +373,114 @@ DOWNLOAD_PAPER_TOOL = Tool(
 )
 
 
-async def search_works(client: OpenAlexClient, arguments: Dict[str, Any]) -> List[TextContent]:
-    """Search for works in OpenAlex."""
-    query = arguments["query"]
-    limit = arguments.get("limit", 10)
-    sort = arguments.get("sort")  # No default sort - let OpenAlex use relevance
+def _at_least(value: Any) -> str:
+    """Format a minimum-value filter."""
+    return f">={value}"
 
-    # Filter out invalid sort values for works
-    if sort == "cited_by_count":
-        sort = None  # Use default relevance instead
 
-    # Build filter parameters
-    filter_params = {}
+def _flag(value: Any) -> str:
+    """Format a boolean filter that is only sent when enabled."""
+    return "true"
+
+
+# Tool argument -> (OpenAlex filter key, value formatter) for each search tool
+_WORKS_FILTERS = {
+    "author": ("raw_author_name.search", str),
+    "venue": ("primary_location.source.display_name.search", str),
+    "topic": ("topics.display_name.search", str),
+    "open_access": ("is_oa", _flag),
+}
+
+_AUTHORS_FILTERS = {
+    "institution": ("last_known_institution.display_name.search", str),
+    "topic": ("topics.display_name.search", str),
+    "h_index_min": ("h_index", _at_least),
+    "works_count_min": ("works_count", _at_least),
+}
 
-    if author := arguments.get("author"):
-        filter_params["raw_author_name.search"] = author
+_INSTITUTIONS_FILTERS = {
+    "country": ("country_code", str),
+    "institution_type": ("type", str),
+    "works_count_min": ("works_count", _at_least),
+}
 
-    # Handle year range properly using separate filters
-    year_from = arguments.get("year_from")
-    year_to = arguments.get("year_to")
+_SOURCES_FILTERS = {
+    "source_type": ("type", str),
+    "publisher": ("host_organization_name.search", str),
+    "open_access": ("is_oa", _flag),
+    "works_count_min": ("works_count", _at_least),
+}
 
-    # Ensure year values are integers
-    if year_from is not None:
-        year_from = int(year_from)
-    if year_to is not None:
-        year_to = int(year_to)
 
-    # Always use date range filters for year filtering
-    if year_from and year_to:
-        filter_params["from_publication_date"] = f"{year_from}-01-01"
-        filter_params["to_publication_date"] = f"{year_to}-12-31"
-    elif year_from:
-        filter_params["from_publication_date"] = f"{year_from}-01-01"
-    elif year_to:
-        filter_params["to_publication_date"] = f"{year_to}-12-31"
+def _normalize_work_id(work_id: str) -> str:
+    """Convert a work ID, OpenAlex URL or bare DOI into a form the API accepts."""
+    # Extract work ID from full OpenAlex URL
+    if work_id.startswith("https://openalex.org/"):
+        return work_id.split("/")[-1]  # Extract just the ID (W123456789)
+    # Handle DOI format - keep as full DOI URL for API
+    if work_id.startswith("10."):
+        return f"https://doi.org/{work_id}"
+    # If it's just a number, add W prefix
+    if work_id.isdigit():
+        return f"W{work_id}"
+    # If it already starts with W or is a DOI URL, keep as is
+    return work_id
+
+
+# Author IDs that the API accepts without a prefix being added
+_AUTHOR_ID_PREFIXES = ("A", "https://openalex.org/A", "https://orcid.org/")
+
+
+def _normalize_author_id(author_id: str) -> str:
+    """Convert an author ID, bare ORCID or numeric ID into a form the API accepts."""
+    # Handle ORCID format
+    if author_id.startswith("0000-"):
+        return f"https://orcid.org/{author_id}"
+    if not author_id.startswith(_AUTHOR_ID_PREFIXES):
+        return f"A{author_id}"
+    return author_id
+
+
+def _build_filters(spec: Dict[str, Any], **arguments: Any) -> Dict[str, str]:
+    """Turn the tool arguments that are set into OpenAlex filter parameters."""
+    filter_params = {}
+    for name, value in arguments.items():
+        if value:
+            key, fmt = spec[name]
+            filter_params[key] = fmt(value)
+    return filter_params
+
+
+async def search_works(
+    client: OpenAlexClient,
+    *,
+    query: str,
+    author: Optional[str] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    venue: Optional[str] = None,
+    topic: Optional[str] = None,
+    open_access: Optional[bool] = None,
+    sort: Optional[str] = None,  # No default sort - let OpenAlex use relevance
+    limit: int = 10
+) -> str:
+    """Search for works in OpenAlex."""
 
-    if venue := arguments.get("venue"):
-        filter_params["primary_location.source.display_name.search"] = venue
+    # Filter out invalid sort values for works
+    if sort == "cited_by_count":
+        sort = None  # Use default relevance instead
 
-    if topic := arguments.get("topic"):
-        filter_params["topics.display_name.search"] = topic
+    # Build filter parameters
+    filter_params = _build_filters(
+        _WORKS_FILTERS, author=author, venue=venue, topic=topic, open_access=open_access
+    )
 
-    if arguments.get("open_access"):
-        filter_params["is_oa"] = "true"
+    # Always use date range filters for year filtering; int() accepts years sent
+    # as strings
+    if year_from:
+        filter_params["from_publication_date"] = f"{int(year_from)}-01-01"
+    if year_to:
+        filter_params["to_publication_date"] = f"{int(year_to)}-12-31"
 
     try:
         response = await client.get_works(
@@ -441,46 +494,40 @@ async def search_works(client: OpenAlexClient, arguments: Dict[str, Any]) -> Lis
         meta = response.get("meta", {})
 
         if not results:
-            return [TextContent(
-                type="text",
-                text=f"No works found for query: '{query}'"
-            )]
+            return f"No works found for query: '{query}'"
 
         # Format results
-        content = f"Found {meta.get('count', len(results))} works for '{query}':\n\n"
-
-        for i, work in enumerate(results, 1):
-            content += f"{i}. {format_work_summary(work)}\n"
+        parts = [f"Found {meta.get('count', len(results))} works for '{query}':\n\n"]
+        parts.extend(
+            f"{i}. {format_work_summary(work)}\n" for i, work in enumerate(results, 1)
+        )
 
-        return [TextContent(type="text", text=content)]
+        return "".join(parts)
 
     except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"Error searching works: {str(e)}"
-        )]
-
-
-async def search_authors(client: OpenAlexClient, arguments: Dict[str, Any]) -> List[TextContent]:
+        return f"Error searching works: {e}"
+
+
+async def search_authors(
+    client: OpenAlexClient,
+    *,
+    query: str,
+    institution: Optional[str] = None,
+    topic: Optional[str] = None,
+    h_index_min: Optional[int] = None,
+    works_count_min: Optional[int] = None,
+    sort: Optional[str] = None,
+    limit: int = 10
+) -> str:
     """Search for authors in OpenAlex."""
-    query = arguments["query"]
-    limit = arguments.get("limit", 10)
-    sort = arguments.get("sort")
-
     # Build filter parameters
-    filter_params = {}
-
-    if institution := arguments.get("institution"):
-        filter_params["last_known_institution.display_name.search"] = institution
-
-    if topic := arguments.get("topic"):
-        filter_params["topics.display_name.search"] = topic
-
-    if h_index_min := arguments.get("h_index_min"):
-        filter_params["h_index"] = f">={h_index_min}"
-
-    if works_count_min := arguments.get("works_count_min"):
-        filter_params["works_count"] = f">={works_count_min}"
+    filter_params = _build_filters(
+        _AUTHORS_FILTERS,
+        institution=institution,
+        topic=topic,
+        h_index_min=h_index_min,
+        works_count_min=works_count_min,
+    )
 
     try:
         response = await client.get_authors(
@@ -494,43 +541,39 @@ async def search_authors(client: OpenAlexClient, arguments: Dict[str, Any]) -> L
         meta = response.get("meta", {})
 
         if not results:
-            return [TextContent(
-                type="text",
-                text=f"No authors found for query: '{query}'"
-            )]
+            return f"No authors found for query: '{query}'"
 
         # Format results
-        content = f"Found {meta.get('count', len(results))} authors for '{query}':\n\n"
-
-        for i, author in enumerate(results, 1):
-            content += f"{i}. {format_author_summary(author)}\n"
+        parts = [f"Found {meta.get('count', len(results))} authors for '{query}':\n\n"]
+        parts.extend(
+            f"{i}. {format_author_summary(author)}\n"
+            for i, author in enumerate(results, 1)
+        )
 
-        return [TextContent(type="text", text=content)]
+        return "".join(parts)
 
     except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"Error searching authors: {str(e)}"
-        )]
-
-
-async def search_institutions(client: OpenAlexClient, arguments: Dict[str, Any]) -> List[TextContent]:
+        return f"Error searching authors: {e}"
+
+
+async def search_institutions(
+    client: OpenAlexClient,
+    *,
+    query: str,
+    country: Optional[str] = None,
+    institution_type: Optional[str] = None,
+    works_count_min: Optional[int] = None,
+    sort: Optional[str] = None,
+    limit: int = 10
+) -> str:
     """Search for institutions in OpenAlex."""
-    query = arguments["query"]
-    limit = arguments.get("limit", 10)
-    sort = arguments.get("sort")
-
     # Build filter parameters
-    filter_params = {}
-
-    if country := arguments.get("country"):
-        filter_params["country_code"] = country
-
-    if inst_type := arguments.get("type"):
-        filter_params["type"] = inst_type
-
-    if works_count_min := arguments.get("works_count_min"):
-        filter_params["works_count"] = f">={works_count_min}"
+    filter_params = _build_filters(
+        _INSTITUTIONS_FILTERS,
+        country=country,
+        institution_type=institution_type,
+        works_count_min=works_count_min,
+    )
 
     try:
         response = await client.get_institutions(
@@ -544,46 +587,42 @@ async def search_institutions(client: OpenAlexClient, arguments: Dict[str, Any])
         meta = response.get("meta", {})
 
         if not results:
-            return [TextContent(
-                type="text",
-                text=f"No institutions found for query: '{query}'"
-            )]
+            return f"No institutions found for query: '{query}'"
 
         # Format results
-        content = f"Found {meta.get('count', len(results))} institutions for '{query}':\n\n"
-
-        for i, institution in enumerate(results, 1):
-            content += f"{i}. {format_institution_summary(institution)}\n"
+        count = meta.get('count', len(results))
+        parts = [f"Found {count} institutions for '{query}':\n\n"]
+        parts.extend(
+            f"{i}. {format_institution_summary(institution)}\n"
+            for i, institution in enumerate(results, 1)
+        )
 
-        return [TextContent(type="text", text=content)]
+        return "".join(parts)
 
     except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"Error searching institutions: {str(e)}"
-        )]
-
-
-async def search_sources(client: OpenAlexClient, arguments: Dict[str, Any]) -> List[TextContent]:
+        return f"Error searching institutions: {e}"
+
+
+async def search_sources(
+    client: OpenAlexClient,
+    *,
+    query: str,
+    source_type: Optional[str] = None,
+    publisher: Optional[str] = None,
+    open_access: Optional[bool] = None,
+    works_count_min: Optional[int] = None,
+    sort: Optional[str] = None,
+    limit: int = 10
+) -> str:
     """Search for sources in OpenAlex."""
-    query = arguments["query"]
-    limit = arguments.get("limit", 10)
-    sort = arguments.get("sort")
-
     # Build filter parameters
-    filter_params = {}
-
-    if source_type := arguments.get("type"):
-        filter_params["type"] = source_type
-
-    if publisher := arguments.get("publisher"):
-        filter_params["host_organization_name.search"] = publisher
-
-    if arguments.get("open_access"):
-        filter_params["is_oa"] = "true"
-
-    if works_count_min := arguments.get("works_count_min"):
-        filter_params["works_count"] = f">={works_count_min}"
+    filter_params = _build_filters(
+        _SOURCES_FILTERS,
+        source_type=source_type,
+        publisher=publisher,
+        open_access=open_access,
+        works_count_min=works_count_min,
+    )
 
     try:
         response = await client.get_sources(
@@ -597,50 +636,32 @@ async def search_sources(client: OpenAlexClient, arguments: Dict[str, Any]) -> L
         meta = response.get("meta", {})
 
         if not results:
-            return [TextContent(
-                type="text",
-                text=f"No sources found for query: '{query}'"
-            )]
+            return f"No sources found for query: '{query}'"
 
         # Format results
-        content = f"Found {meta.get('count', len(results))} sources for '{query}':\n\n"
-
-        for i, source in enumerate(results, 1):
-            content += f"{i}. {format_source_summary(source)}\n"
+        parts = [f"Found {meta.get('count', len(results))} sources for '{query}':\n\n"]
+        parts.extend(
+            f"{i}. {format_source_summary(source)}\n"
+            for i, source in enumerate(results, 1)
+        )
 
-        return [TextContent(type="text", text=content)]
+        return "".join(parts)
 
     except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"Error searching sources: {str(e)}"
-        )]
+        return f"Error searching sources: {e}"
 
 
-async def get_work_details(client: OpenAlexClient, arguments: Dict[str, Any]) -> List[TextContent]:
+async def get_work_details(client: OpenAlexClient, *, work_id: str) -> str:
     """Get detailed information about a specific work."""
-    work_id = arguments["work_id"]
     original_id = work_id  # Keep for error messages
 
-    # Extract work ID from full OpenAlex URL
-    if work_id.startswith("https://openalex.org/"):
-        work_id = work_id.split("/")[-1]  # Extract just the ID (W123456789)
-    # Handle DOI format - keep as full DOI URL for API
-    elif work_id.startswith("10."):
-        work_id = f"https://doi.org/{work_id}"
-    # If it's just a number, add W prefix
-    elif work_id.isdigit():
-        work_id = f"W{work_id}"
-    # If it already starts with W or is a DOI URL, keep as is
+    work_id = _normalize_work_id(work_id)
 
     try:
         response = await client.get_works(work_id=work_id)
 
         if not response:
-            return [TextContent(
-                type="text",
-                text=f"Work not found: {original_id}"
-            )]
+            return f"Work not found: {original_id}"
 
         work = response
 
@@ -667,33 +688,22 @@ async def get_work_details(client: OpenAlexClient, arguments: Dict[str, Any]) ->
         ref_count = len(work.get("referenced_works", []))
         content += f"References: {ref_count} works\n"
 
-        return [TextContent(type="text", text=content)]
+        return content
 
     except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"Error getting work details: {str(e)}"
-        )]
+        return f"Error getting work details: {e}"
 
 
-async def get_author_profile(client: OpenAlexClient, arguments: Dict[str, Any]) -> List[TextContent]:
+async def get_author_profile(client: OpenAlexClient, *, author_id: str) -> str:
     """Get detailed profile information about a specific author."""
-    author_id = arguments["author_id"]
 
-    # Handle ORCID format
-    if author_id.startswith("0000-"):
-        author_id = f"https://orcid.org/{author_id}"
-    elif not author_id.startswith(("A", "https://openalex.org/A", "https://orcid.org/")):
-        author_id = f"A{author_id}"
+    author_id = _normalize_author_id(author_id)
 
     try:
         response = await client.get_authors(author_id=author_id)
 
         if not response:
-            return [TextContent(
-                type="text",
-                text=f"Author not found: {author_id}"
-            )]
+            return f"Author not found: {author_id}"
 
         author = response
 
@@ -702,50 +712,40 @@ async def get_author_profile(client: OpenAlexClient, arguments: Dict[str, Any])
 
         # Add career timeline
         if counts_by_year := author.get("counts_by_year", []):
-            recent_years = sorted(counts_by_year, key=lambda x: x.get("year", 0), reverse=True)[:5]
-            content += "\n**Recent Publication Activity:**\n"
-            for year_data in recent_years:
-                year = year_data.get("year")
-                works = year_data.get("works_count", 0)
-                citations = year_data.get("cited_by_count", 0)
-                content += f"- {year}: {works} works, {citations} citations\n"
+            recent_years = heapq.nlargest(
+                5, counts_by_year, key=lambda x: x.get("year", 0)
+            )
+            content += "\n**Recent Publication Activity:**\n" + "".join(
+                f"- {year_data.get('year')}: {year_data.get('works_count', 0)} works, "
+                f"{year_data.get('cited_by_count', 0)} citations\n"
+                for year_data in recent_years
+            )
 
         # Add alternative names
         if alt_names := author.get("display_name_alternatives", []):
             content += f"\n**Alternative names:** {', '.join(alt_names[:3])}\n"
 
-        return [TextContent(type="text", text=content)]
+        return content
 
     except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"Error getting author profile: {str(e)}"
-        )]
+        return f"Error getting author profile: {e}"
 
 
-async def get_citations(client: OpenAlexClient, arguments: Dict[str, Any]) -> List[TextContent]:
+async def get_citations(
+    client: OpenAlexClient,
+    *,
+    work_id: str,
+    sort: str = "publication_date",
+    limit: int = 20
+) -> str:
     """Get works that cite a specific work."""
-    work_id = arguments["work_id"]
-    limit = arguments.get("limit", 20)
-    sort = arguments.get("sort", "publication_date")
 
-    # Extract work ID from full OpenAlex URL
-    if work_id.startswith("https://openalex.org/"):
-        work_id = work_id.split("/")[-1]  # Extract just the ID (W123456789)
-    # Handle DOI format - keep as full DOI URL for API
-    elif work_id.startswith("10."):
-        work_id = f"https://doi.org/{work_id}"
-    # If it's just a number, add W prefix
-    elif work_id.isdigit():
-        work_id = f"W{work_id}"
-    # If it already starts with W or is a DOI URL, keep as is
+    work_id = _normalize_work_id(work_id)
 
     try:
         # Search for works that cite this work
-        filter_params = {"cites": work_id}
-
         response = await client.get_works(
-            filter_params=filter_params,
+            cites=work_id,
             sort=sort,
             per_page=limit
         )
@@ -754,52 +754,55 @@ async def get_citations(client: OpenAlexClient, arguments: Dict[str, Any]) -> Li
         meta = response.get("meta", {})
 
         if not results:
-            return [TextContent(
-                type="text",
-                text=f"No citations found for work: {work_id}"
-            )]
+            return f"No citations found for work: {work_id}"
 
         # Format results
-        content = f"Found {meta.get('count', len(results))} works citing {work_id}:\n\n"
-
-        for i, work in enumerate(results, 1):
-            content += f"{i}. {format_work_summary(work)}\n"
+        parts = [f"Found {meta.get('count', len(results))} works citing {work_id}:\n\n"]
+        parts.extend(
+            f"{i}. {format_work_summary(work)}\n" for i, work in enumerate(results, 1)
+        )
 
-        return [TextContent(type="text", text=content)]
+        return "".join(parts)
 
     except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"Error getting citations: {str(e)}"
-        )]
+        return f"Error getting citations: {e}"
 
 
-async def download_paper(client: OpenAlexClient, arguments: Dict[str, Any]) -> List[TextContent]:
+def _prepare_output_dir(output_path: str) -> str:
+    """Create the download directory and return a writable directory to save into."""
+    os.makedirs(output_path, exist_ok=True)
+    # Test if directory is writable
+    test_file = os.path.join(output_path, ".write_test")
+    try:
+        with open(test_file, "w") as f:
+            f.write("test")
+        os.remove(test_file)
+    except (OSError, PermissionError):
+        # Fallback to home directory if Downloads is not writable
+        output_path = os.path.expanduser("~")
+        os.makedirs(output_path, exist_ok=True)
+    return output_path
+
+
+async def download_paper(
+    client: OpenAlexClient,
+    *,
+    work_id: str,
+    output_path: Optional[str] = None,
+    filename: Optional[str] = None
+) -> str:
     """Download a paper's PDF if available through open access."""
-    work_id = arguments["work_id"]
-    output_path = arguments.get("output_path", os.path.expanduser("~/Downloads"))
-    custom_filename = arguments.get("filename")
+    if output_path is None:
+        output_path = os.path.expanduser("~/Downloads")
 
-    # Extract work ID from full OpenAlex URL
-    if work_id.startswith("https://openalex.org/"):
-        work_id = work_id.split("/")[-1]  # Extract just the ID (W123456789)
-    # Handle DOI format - keep as full DOI URL for API
-    elif work_id.startswith("10."):
-        work_id = f"https://doi.org/{work_id}"
-    # If it's just a number, add W prefix
-    elif work_id.isdigit():
-        work_id = f"W{work_id}"
-    # If it already starts with W or is a DOI URL, keep as is
+    work_id = _normalize_work_id(work_id)
 
     try:
         # First get the work details to find PDF URL
         response = await client.get_works(work_id=work_id)
 
         if not response:
-            return [TextContent(
-                type="text",
-                text=f"Work not found: {work_id}"
-            )]
+            return f"Work not found: {work_id}"
 
         work = response
         title = work.get("title") or work.get("display_name", "Unknown Title")
@@ -817,68 +820,49 @@ async def download_paper(client: OpenAlexClient, arguments: Dict[str, Any]) -> L
                     break
 
         if not pdf_url:
-            return [TextContent(
-                type="text",
-                text=f"No open access PDF available for: {title}\n"
-                     f"This paper may be behind a paywall or not available in PDF format."
-            )]
+            return (
+                f"No open access PDF available for: {title}\n"
+                f"This paper may be behind a paywall or not available in PDF format."
+            )
 
         # Generate filename if not provided
-        if not custom_filename:
+        if not filename:
             # Clean title for filename
-            clean_title = re.sub(r'[<>:"/\\|?*]', '', title)
-            clean_title = clean_title.replace(' ', '_')[:50]  # Limit length
-            custom_filename = f"{clean_title}.pdf"
+            # Clean title for filename, limited in length
+            clean_title = title.translate(_FILENAME_UNSAFE_CHARS).replace(' ', '_')[:50]
+            filename = f"{clean_title}.pdf"
 
-        # Ensure output directory exists and is writable
+        # Ensure output directory exists and is writable, off the event loop
         try:
-            os.makedirs(output_path, exist_ok=True)
-            # Test if directory is writable
-            test_file = os.path.join(output_path, ".write_test")
-            try:
-                with open(test_file, "w") as f:
-                    f.write("test")
-                os.remove(test_file)
-            except (OSError, PermissionError):
-                # Fallback to home directory if Downloads is not writable
-                output_path = os.path.expanduser("~")
-                os.makedirs(output_path, exist_ok=True)
+            output_path = await asyncio.to_thread(_prepare_output_dir, output_path)
         except (OSError, PermissionError) as e:
-            return [TextContent(
-                type="text",
-                text=f"Cannot create or write to directory: {output_path}\n"
-                     f"Error: {str(e)}\n"
-                     f"Please specify a writable output_path parameter."
-            )]
+            return (
+                f"Cannot create or write to directory: {output_path}\n"
+                f"Error: {e}\n"
+                f"Please specify a writable output_path parameter."
+            )
 
         # Full file path
-        file_path = os.path.join(output_path, custom_filename)
+        file_path = os.path.join(output_path, filename)
 
         # Download the PDF
-        success = await client.download_pdf(pdf_url, file_path)
+        file_size = await client.download_pdf(pdf_url, file_path)
 
-        if success:
-            # Get file size for confirmation
-            file_size = os.path.getsize(file_path)
+        if file_size is not None:
             file_size_mb = file_size / (1024 * 1024)
 
-            return [TextContent(
-                type="text",
-                text=f"Successfully downloaded: {title}\n"
-                     f"File: {file_path}\n"
-                     f"Size: {file_size_mb:.2f} MB\n"
-                     f"Source: {pdf_url}"
-            )]
+            return (
+                f"Successfully downloaded: {title}\n"
+                f"File: {file_path}\n"
+                f"Size: {file_size_mb:.2f} MB\n"
+                f"Source: {pdf_url}"
+            )
         else:
-            return [TextContent(
-                type="text",
-                text=f"Failed to download PDF for: {title}\n"
-                     f"URL: {pdf_url}\n"
-                     f"Check logs for detailed error information."
-            )]
+            return (
+                f"Failed to download PDF for: {title}\n"
+                f"URL: {pdf_url}\n"
+                f"Check logs for detailed error information."
+            )
 
     except Exception as e:
-        return [TextContent(
-            type="text",
-            text=f"Error downloading paper: {str(e)}"
-        )]
+        return f"Error downloading paper: {e}"
@@ -0,0 +1,14 @@
+"""Test doubles shared by the test modules and their fixtures."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class FakeResponse:
+    """The parts of a successful httpx.Response that the client reads."""
+
+    content: bytes
+    status_code: int = 200
+
+    def raise_for_status(self) -> None:
+        """Successful responses never raise."""
@@ -1,11 +1,29 @@
 """Tests for the OpenAlex API client."""
 
-from unittest.mock import MagicMock
+import asyncio
+import threading
+from unittest.mock import patch
+from urllib.parse import parse_qsl, urlsplit
 
 import httpx
+import orjson
 import pytest
 
-from src.openalex_mcp.client import OpenAlexClient
+from src.openalex_mcp.client import (
+    OpenAlexAPIError,
+    OpenAlexClient,
+    ResponseCache,
+    aclose_shared,
+    get_shared_client,
+)
+from tests.helpers import FakeResponse
+
+
+def assert_query_contains(url, expected):
+    """Assert that the query string of url has each expected parameter value."""
+    query = dict(parse_qsl(urlsplit(url).query))
+    for name, value in expected.items():
+        assert query.get(name) == str(value), f"expected {name}={value!r} in {url}"
 
 
 class TestOpenAlexClient:
@@ -34,15 +52,26 @@ class TestOpenAlexClient:
         """Test URL building with email parameter."""
         client = OpenAlexClient(email="test@example.com")
         url = client._build_url("works")
-        assert "mailto=test%40example.com" in url
+        assert_query_contains(url, {"mailto": "test@example.com"})
 
     def test_build_url_with_params(self):
         """Test URL building with query parameters."""
         client = OpenAlexClient()
         params = {"search": "machine learning", "page": 1}
         url = client._build_url("works", params)
-        assert "search=machine+learning" in url
-        assert "page=1" in url
+        assert_query_contains(url, {"search": "machine learning", "page": 1})
+
+    def test_build_url_does_not_mutate_params(self):
+        """Test that the polite-pool email is not injected into caller params."""
+        client = OpenAlexClient(email="test+alex@example.com")
+        params = {"search": "machine learning"}
+        url = client._build_url("works", params)
+
+        assert url == (
+            "https://api.openalex.org/works"
+            "?search=machine+learning&mailto=test%2Balex%40example.com"
+        )
+        assert params == {"search": "machine learning"}
 
     def test_build_url_strip_leading_slash(self):
         """Test URL building strips leading slash from endpoint."""
@@ -50,8 +79,7 @@ class TestOpenAlexClient:
         url = client._build_url("/works")
         assert url == "https://api.openalex.org/works"
 
-    @pytest.mark.asyncio
-    async def test_context_manager(self):
+    async def test_context_manager(self, offline_shared_client):
         """Test async context manager functionality."""
         client = OpenAlexClient()
 
@@ -60,50 +88,238 @@ class TestOpenAlexClient:
             assert client._client is not None
             assert isinstance(client._client, httpx.AsyncClient)
 
-        # Client should be closed after context exit
+        # The shared client stays open after context exit and is reused
+        assert not client._client.is_closed
+        async with OpenAlexClient() as other:
+            assert other._client is client._client
+
+        await aclose_shared()
         assert client._client.is_closed
 
-    @pytest.mark.asyncio
-    async def test_make_request_success(self, mock_httpx_client, sample_work_data):
-        """Test successful API request."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_work_data
-        mock_httpx_client.get.return_value = mock_response
+    async def test_start_and_stop(self, offline_shared_client):
+        """Test explicit start/stop outside a context manager."""
+        client = OpenAlexClient()
 
-        client = OpenAlexClient(email="test@example.com")
-        client._client = mock_httpx_client
+        await client.start()
+        assert isinstance(client._client, httpx.AsyncClient)
+
+        await client.stop()
+        assert client._client is None
+
+        with pytest.raises(RuntimeError, match="Client not initialized"):
+            await client._make_request("works")
+
+        await aclose_shared()
+
+    async def test_shared_client_closed_on_its_loop_when_loop_changes(
+        self, monkeypatch, offline_shared_client
+    ):
+        """Test that a shared client left on a running loop is closed on that loop."""
+        monkeypatch.setattr("src.openalex_mcp.client._shared_client", None)
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+
+        async def open_shared():
+            return get_shared_client()
+
+        try:
+            old = asyncio.run_coroutine_threadsafe(open_shared(), other_loop).result()
+
+            new = get_shared_client()
+            assert new is not old
+
+            # The close was queued on the old loop ahead of this no-op
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop)
+            )
+            assert old.is_closed
+            assert not new.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+            await aclose_shared()
+
+    async def test_shared_client_dropped_when_its_loop_stopped(
+        self, monkeypatch, offline_shared_client
+    ):
+        """Test that nothing is queued on a stopped loop that would never run it."""
+        monkeypatch.setattr("src.openalex_mcp.client._shared_client", None)
+
+        async def open_shared():
+            return get_shared_client()
+
+        # The loop finishes its work and stops, but is left open
+        other_loop = asyncio.new_event_loop()
+        opened = []
+        thread = threading.Thread(
+            target=lambda: opened.append(other_loop.run_until_complete(open_shared()))
+        )
+        thread.start()
+        thread.join()
+        old = opened[0]
+
+        try:
+            new = get_shared_client()
+            assert new is not old
+
+            # Running the old loop again finds no close queued for its client
+            thread = threading.Thread(
+                target=lambda: other_loop.run_until_complete(asyncio.sleep(0))
+            )
+            thread.start()
+            thread.join()
+            assert not old.is_closed
+        finally:
+            thread = threading.Thread(
+                target=lambda: other_loop.run_until_complete(old.aclose())
+            )
+            thread.start()
+            thread.join()
+            other_loop.close()
+            await aclose_shared()
+
+    async def test_shared_client_replaced_after_its_loop_closed(
+        self, monkeypatch, offline_shared_client
+    ):
+        """Test that a shared client from a closed loop is dropped for a fresh one."""
+        monkeypatch.setattr("src.openalex_mcp.client._shared_client", None)
+
+        async def open_shared():
+            return get_shared_client()
+
+        # asyncio.run closes its loop on return; a thread keeps it off this one
+        opened = []
+        thread = threading.Thread(
+            target=lambda: opened.append(asyncio.run(open_shared()))
+        )
+        thread.start()
+        thread.join()
+        old = opened[0]
+
+        new = get_shared_client()
+        assert new is not old
+        assert not new.is_closed
+
+        await aclose_shared()
+
+    async def test_make_request_success(
+        self, wired_client, mock_httpx_client, sample_work_data
+    ):
+        """Test successful API request."""
+        client = wired_client(sample_work_data, email="test@example.com")
 
         result = await client._make_request("works/W123")
 
         assert result == sample_work_data
         mock_httpx_client.get.assert_called_once()
 
-    @pytest.mark.asyncio
+    async def test_make_request_through_transport(self, mock_transport):
+        """Test the request httpx actually sends for a filtered search."""
+        transport, requests = mock_transport
+        client = OpenAlexClient(email="test@example.com")
+
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client._client = http_client
+            result = await client.get_works(
+                search="machine learning",
+                filter_params={"is_oa": "true"},
+                per_page=50
+            )
+
+        assert result == {}
+        assert len(requests) == 1
+        url = requests[0].url
+        assert url.path == "/works"
+        assert url.params["search"] == "machine learning"
+        assert url.params["filter"] == "is_oa:true"
+        assert url.params["per_page"] == "50"
+        assert url.params["mailto"] == "test@example.com"
+
+    async def test_make_request_cached(
+        self, wired_client, mock_httpx_client, sample_work_data
+    ):
+        """Test that repeated requests are served from the response cache."""
+        client = wired_client(sample_work_data, email="test@example.com")
+
+        first = await client._make_request("works", {"search": "attention"})
+        second = await client._make_request("works", {"search": "attention"})
+
+        assert first == second == sample_work_data
+        mock_httpx_client.get.assert_called_once()
+
+        # Cached responses are copies, so callers cannot corrupt the cache
+        second["title"] = "Changed"
+        third = await client._make_request("works", {"search": "attention"})
+        assert third["title"] == sample_work_data["title"]
+
+    async def test_make_request_cache_disabled(
+        self, wired_client, mock_httpx_client, sample_work_data
+    ):
+        """Test that caching can be turned off through config."""
+        client = wired_client(sample_work_data)
+
+        with patch("src.openalex_mcp.client.config.cache_enabled", False):
+            await client._make_request("works/W123")
+            await client._make_request("works/W123")
+
+        assert mock_httpx_client.get.call_count == 2
+
+    def test_response_cache_eviction_and_expiry(self):
+        """Test LRU eviction and TTL expiry of the response cache."""
+        cache = ResponseCache(max_size=2, ttl=60)
+        cache.set("a", {"id": "a"})
+        cache.set("b", {"id": "b"})
+        cache.get("a")  # "a" is now most recently used
+        cache.set("c", {"id": "c"})
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": "a"}
+
+        with patch("src.openalex_mcp.client.time.monotonic", return_value=1e12):
+            assert cache.get("a") is None
+
+    async def test_entity_lookups_cached_longer(
+        self, wired_client, mock_httpx_client, sample_work_data
+    ):
+        """Test that single-entity responses use the longer entity cache TTL."""
+        client = wired_client(sample_work_data)
+
+        with patch("src.openalex_mcp.client.time.monotonic", return_value=0), \
+                patch("src.openalex_mcp.client.config.entity_cache_ttl", 3600):
+            await client.get_works(work_id="W123")
+            await client.get_works(search="attention")
+
+        # Past the search TTL but within the entity TTL
+        with patch("src.openalex_mcp.client.time.monotonic", return_value=1800):
+            await client.get_works(work_id="W123")
+            await client.get_works(search="attention")
+
+        assert mock_httpx_client.get.call_count == 3
+
     async def test_make_request_http_error(self, mock_httpx_client):
         """Test API request with HTTP error."""
-        # Setup mock response with error
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-
         error = httpx.HTTPStatusError(
             "404 Not Found",
-            request=MagicMock(),
-            response=mock_response
+            request=httpx.Request("GET", "https://api.openalex.org/works/nonexistent"),
+            response=httpx.Response(404, text="Not Found")
         )
         mock_httpx_client.get.side_effect = error
 
         client = OpenAlexClient()
         client._client = mock_httpx_client
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(OpenAlexAPIError) as exc_info:
             await client._make_request("works/nonexistent")
 
         assert "OpenAlex API error (404)" in str(exc_info.value)
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.retryable is False
+        # Client errors are not retried
+        mock_httpx_client.get.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_make_request_network_error(self, mock_httpx_client):
         """Test API request with network error."""
         error = httpx.RequestError("Connection failed")
@@ -112,12 +328,37 @@ class TestOpenAlexClient:
         client = OpenAlexClient()
         client._client = mock_httpx_client
 
-        with pytest.raises(Exception) as exc_info:
-            await client._make_request("works")
+        with patch("src.openalex_mcp.client.config.retry_backoff", 0):
+            with pytest.raises(OpenAlexAPIError) as exc_info:
+                await client._make_request("works")
 
         assert "Request failed" in str(exc_info.value)
+        assert exc_info.value.retryable is True
+        # Initial attempt plus the default two retries
+        assert mock_httpx_client.get.call_count == 3
+
+    async def test_make_request_retries_server_error(
+        self, mock_httpx_client, sample_work_data
+    ):
+        """Test that a transient server error is retried until it succeeds."""
+        error = httpx.HTTPStatusError(
+            "503 Service Unavailable",
+            request=httpx.Request("GET", "https://api.openalex.org/works/W123"),
+            response=httpx.Response(503, text="Service Unavailable")
+        )
+
+        ok_response = FakeResponse(orjson.dumps(sample_work_data))
+        mock_httpx_client.get.side_effect = [error, ok_response]
+
+        client = OpenAlexClient()
+        client._client = mock_httpx_client
+
+        with patch("src.openalex_mcp.client.config.retry_backoff", 0):
+            result = await client._make_request("works/W123")
+
+        assert result == sample_work_data
+        assert mock_httpx_client.get.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_make_request_without_client(self):
         """Test making request without initialized client."""
         client = OpenAlexClient()
@@ -127,36 +368,36 @@ class TestOpenAlexClient:
 
         assert "Client not initialized" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_get_works_single(self, mock_httpx_client, sample_work_data):
-        """Test getting a single work by ID."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_work_data
-        mock_httpx_client.get.return_value = mock_response
-
-        client = OpenAlexClient()
-        client._client = mock_httpx_client
-
-        result = await client.get_works(work_id="W123")
-
-        assert result == sample_work_data
+    @pytest.mark.parametrize("method, id_arg, entity_id, endpoint, payload_fixture", [
+        ("get_works", "work_id", "W123", "works/W123", "sample_work_data"),
+        ("get_authors", "author_id", "A123", "authors/A123", "sample_author_data"),
+        (
+            "get_institutions", "institution_id", "I123",
+            "institutions/I123", "sample_institution_data",
+        ),
+        ("get_sources", "source_id", "S123", "sources/S123", "sample_source_data"),
+    ])
+    async def test_get_entity_by_id(
+        self, request, wired_client, mock_httpx_client,
+        method, id_arg, entity_id, endpoint, payload_fixture
+    ):
+        """Test getting a single entity by ID."""
+        payload = request.getfixturevalue(payload_fixture)
+        client = wired_client(payload)
+
+        result = await getattr(client, method)(**{id_arg: entity_id})
+
+        assert result == payload
         # Verify the correct endpoint was called
         called_url = mock_httpx_client.get.call_args[0][0]
-        assert "works/W123" in called_url
+        assert endpoint in called_url
 
-    @pytest.mark.asyncio
-    async def test_get_works_search(self, mock_httpx_client, sample_search_response):
+    async def test_get_works_search(
+        self, wired_client, mock_httpx_client, mutable_search_response
+    ):
         """Test searching works."""
-        sample_search_response["results"] = [{"id": "W123", "title": "Test Work"}]
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_search_response
-        mock_httpx_client.get.return_value = mock_response
-
-        client = OpenAlexClient()
-        client._client = mock_httpx_client
+        mutable_search_response["results"] = [{"id": "W123", "title": "Test Work"}]
+        client = wired_client(mutable_search_response)
 
         result = await client.get_works(
             search="machine learning",
@@ -165,24 +406,21 @@ class TestOpenAlexClient:
             per_page=50
         )
 
-        assert result == sample_search_response
+        assert result == mutable_search_response
         # Verify parameters were included
         called_url = mock_httpx_client.get.call_args[0][0]
-        assert "search=machine+learning" in called_url
-        assert "sort=cited_by_count" in called_url
-        assert "page=2" in called_url
-        assert "per_page=50" in called_url
-
-    @pytest.mark.asyncio
-    async def test_get_works_with_filters(self, mock_httpx_client, sample_search_response):
+        assert_query_contains(called_url, {
+            "search": "machine learning",
+            "sort": "cited_by_count",
+            "page": 2,
+            "per_page": 50,
+        })
+
+    async def test_get_works_with_filters(
+        self, wired_client, mock_httpx_client, sample_search_response
+    ):
         """Test searching works with filters."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_search_response
-        mock_httpx_client.get.return_value = mock_response
-
-        client = OpenAlexClient()
-        client._client = mock_httpx_client
+        client = wired_client(sample_search_response)
 
         filter_params = {
             "publication_year": ">=2020",
@@ -197,82 +435,124 @@ class TestOpenAlexClient:
 
         assert result == sample_search_response
         called_url = mock_httpx_client.get.call_args[0][0]
-        assert "filter=" in called_url
-        assert "select=id%2Ctitle%2Ccited_by_count" in called_url
+        assert_query_contains(called_url, {
+            "filter": "publication_year:>=2020,is_oa:true",
+            "select": "id,title,cited_by_count",
+        })
 
-    @pytest.mark.asyncio
-    async def test_get_authors(self, mock_httpx_client, sample_author_data):
-        """Test getting author by ID."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_author_data
-        mock_httpx_client.get.return_value = mock_response
+    async def test_get_works_cites(
+        self, wired_client, mock_httpx_client, sample_search_response
+    ):
+        """Test that cites is merged into the caller's filters without mutating them."""
+        client = wired_client(sample_search_response)
 
-        client = OpenAlexClient()
-        client._client = mock_httpx_client
+        filter_params = {"is_oa": "true"}
+        await client.get_works(filter_params=filter_params, cites="W123")
+
+        called_url = mock_httpx_client.get.call_args[0][0]
+        assert_query_contains(called_url, {"filter": "is_oa:true,cites:W123"})
+        assert filter_params == {"is_oa": "true"}
+
+    async def test_pagination_limits(
+        self, wired_client, mock_httpx_client, sample_search_response
+    ):
+        """Test that pagination limits are enforced."""
+        client = wired_client(sample_search_response)
 
-        result = await client.get_authors(author_id="A123")
+        # Request more than max per page (200)
+        await client.get_works(search="test", per_page=300)
 
-        assert result == sample_author_data
         called_url = mock_httpx_client.get.call_args[0][0]
-        assert "authors/A123" in called_url
+        # Should be capped at 200
+        assert_query_contains(called_url, {"per_page": 200})
+
+    async def test_get_works_paginated(self, mock_httpx_client):
+        """Test that the pages covering max_results are fetched concurrently."""
+        async def get(url, **kwargs):
+            page = int(httpx.URL(url).params["page"])
+            return FakeResponse(orjson.dumps({"meta": {"page": page}, "results": []}))
 
-    @pytest.mark.asyncio
-    async def test_get_institutions(self, mock_httpx_client, sample_institution_data):
-        """Test getting institution by ID."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_institution_data
-        mock_httpx_client.get.return_value = mock_response
+        mock_httpx_client.get.side_effect = get
 
         client = OpenAlexClient()
         client._client = mock_httpx_client
 
-        result = await client.get_institutions(institution_id="I123")
-
-        assert result == sample_institution_data
-        called_url = mock_httpx_client.get.call_args[0][0]
-        assert "institutions/I123" in called_url
-
-    @pytest.mark.asyncio
-    async def test_get_sources(self, mock_httpx_client, sample_source_data):
-        """Test getting source by ID."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_source_data
-        mock_httpx_client.get.return_value = mock_response
+        pages = await client.get_works_paginated(
+            filter_params={"cites": "W123"}, per_page=200, max_results=450
+        )
 
+        assert [p["meta"]["page"] for p in pages] == [1, 2, 3]
+        assert mock_httpx_client.get.call_count == 3
+        for page, call in enumerate(mock_httpx_client.get.call_args_list, start=1):
+            assert_query_contains(
+                call[0][0], {"filter": "cites:W123", "page": page, "per_page": 200}
+            )
+
+    @pytest.mark.parametrize("argument, value", [
+        ("per_page", 0),
+        ("per_page", -25),
+        ("max_results", 0),
+        ("max_results", -1),
+    ])
+    async def test_get_works_paginated_rejects_non_positive_sizes(
+        self, mock_httpx_client, argument, value
+    ):
+        """Test that paginated fetches reject page sizes and totals below one."""
         client = OpenAlexClient()
         client._client = mock_httpx_client
 
-        result = await client.get_sources(source_id="S123")
+        with pytest.raises(ValueError, match=f"{argument} must be positive"):
+            await client.get_works_paginated(**{argument: value})
 
-        assert result == sample_source_data
-        called_url = mock_httpx_client.get.call_args[0][0]
-        assert "sources/S123" in called_url
+        mock_httpx_client.get.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_pagination_limits(self, mock_httpx_client, sample_search_response):
-        """Test that pagination limits are enforced."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_search_response
-        mock_httpx_client.get.return_value = mock_response
+    async def test_download_pdf_streams_to_file(self, tmp_path):
+        """Test that PDF downloads are streamed to disk."""
+        pdf_bytes = b"%PDF-1.4" + b"x" * 200_000
+
+        def handler(request):
+            return httpx.Response(
+                200, content=pdf_bytes, headers={"content-type": "application/pdf"}
+            )
 
         client = OpenAlexClient()
-        client._client = mock_httpx_client
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        file_path = tmp_path / "paper.pdf"
 
-        # Request more than max per page (200)
-        await client.get_works(search="test", per_page=300)
+        url = "https://example.com/paper.pdf"
+        assert await client.download_pdf(url, str(file_path)) == len(pdf_bytes)
+        assert file_path.read_bytes() == pdf_bytes
 
-        called_url = mock_httpx_client.get.call_args[0][0]
-        # Should be capped at 200
-        assert "per_page=200" in called_url
+        await client._client.aclose()
+
+    async def test_download_pdf_http_error(self, tmp_path):
+        """Test that a failed PDF download returns None and writes nothing."""
+        def handler(request):
+            return httpx.Response(404, text="Not Found")
 
-    @pytest.mark.asyncio
-    async def test_rate_limiting_semaphore(self):
-        """Test that rate limiting semaphore is properly configured."""
         client = OpenAlexClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        file_path = tmp_path / "paper.pdf"
+
+        url = "https://example.com/paper.pdf"
+        assert await client.download_pdf(url, str(file_path)) is None
+        assert not file_path.exists()
+
+        await client._client.aclose()
+
+    async def test_connection_pool_limits(self, opened_client):
+        """Test that concurrency is capped by the shared connection pool."""
+        pool = opened_client._client._transport._pool
+
+        # Pool size comes from config rather than a per-client semaphore
+        assert pool._max_connections == 10  # default from config
+        assert pool._max_keepalive_connections == 10
+        assert not hasattr(opened_client, "_rate_limiter")
+
+    async def test_shared_client_http2_and_compression(self, opened_client):
+        """Test that the shared client negotiates HTTP/2 and compressed responses."""
+        assert opened_client._client._transport._pool._http2 is True
 
-        # Verify semaphore is created with correct value from config
-        assert client._rate_limiter._value == 10  # default from config
+        accept_encoding = opened_client._client.headers["Accept-Encoding"]
+        assert "gzip" in accept_encoding
+        assert "br" in accept_encoding
@@ -1,73 +1,123 @@
 """Tests for configuration management."""
 
-from unittest.mock import patch
+import copy
+import os
 
 import pytest
 
 from src.openalex_mcp.config import OpenAlexConfig
+from src.openalex_mcp.config import config as global_config
+
+
+def _hide_config_environment(monkeypatch):
+    """Unset any OpenAlex settings inherited from the developer's environment."""
+    for name in list(os.environ):
+        if name.startswith("OPENALEX_") or name in ("LOG_LEVEL", "LOG_API_REQUESTS"):
+            monkeypatch.delenv(name)
+
+
+@pytest.fixture(autouse=True)
+def _clean_environment(monkeypatch):
+    """Run every test without inherited OpenAlex settings."""
+    _hide_config_environment(monkeypatch)
+
+
+@pytest.fixture(scope="session")
+def _pristine_config():
+    """Configuration built once from the default settings."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _hide_config_environment(monkeypatch)
+        return OpenAlexConfig()
+
+
+@pytest.fixture
+def default_config(_pristine_config):
+    """Per-test copy of the default configuration, safe to mutate."""
+    return copy.copy(_pristine_config)
 
 
 class TestOpenAlexConfig:
     """Test the configuration class."""
 
-    @patch.dict('os.environ', {}, clear=True)
-    def test_config_default_values(self):
+    def test_config_default_values(self, default_config):
         """Test configuration with default values."""
-        config = OpenAlexConfig()
+        config = default_config
 
         assert config.email is None
         assert config.timeout == 30.0
         assert config.max_concurrent_requests == 10
+        assert config.max_retries == 2
+        assert config.retry_backoff == 0.5
         assert config.default_page_size == 25
         assert config.max_page_size == 200
         assert config.daily_request_limit == 100000
         assert config.log_level == "INFO"
         assert config.log_api_requests is False
+        assert config.cache_enabled is True
+        assert config.cache_ttl == 600.0
+        assert config.entity_cache_ttl == 3600.0
+        assert config.cache_max_size == 2048
+        assert config.user_agent == "OpenAlexMCP/0.1.0"
 
-    @patch.dict('os.environ', {
-        'OPENALEX_EMAIL': 'test@example.com',
-        'OPENALEX_TIMEOUT': '60.0',
-        'OPENALEX_MAX_CONCURRENT': '20',
-        'OPENALEX_DEFAULT_PAGE_SIZE': '50',
-        'OPENALEX_MAX_PAGE_SIZE': '100',
-        'OPENALEX_DAILY_LIMIT': '50000',
-        'LOG_LEVEL': 'DEBUG',
-        'LOG_API_REQUESTS': 'true'
-    })
-    def test_config_from_environment(self):
+    def test_config_from_environment(self, monkeypatch):
         """Test configuration from environment variables."""
+        for name, value in {
+            'OPENALEX_EMAIL': 'test@example.com',
+            'OPENALEX_TIMEOUT': '60.0',
+            'OPENALEX_MAX_CONCURRENT': '20',
+            'OPENALEX_MAX_RETRIES': '5',
+            'OPENALEX_RETRY_BACKOFF': '1.5',
+            'OPENALEX_DEFAULT_PAGE_SIZE': '50',
+            'OPENALEX_MAX_PAGE_SIZE': '100',
+            'OPENALEX_DAILY_LIMIT': '50000',
+            'LOG_LEVEL': 'DEBUG',
+            'LOG_API_REQUESTS': 'true',
+            'OPENALEX_CACHE_ENABLED': 'false',
+            'OPENALEX_CACHE_TTL': '30',
+            'OPENALEX_ENTITY_CACHE_TTL': '120',
+            'OPENALEX_CACHE_MAX_SIZE': '64'
+        }.items():
+            monkeypatch.setenv(name, value)
+
         config = OpenAlexConfig()
 
         assert config.email == "test@example.com"
         assert config.timeout == 60.0
         assert config.max_concurrent_requests == 20
+        assert config.max_retries == 5
+        assert config.retry_backoff == 1.5
         assert config.default_page_size == 50
         assert config.max_page_size == 100
         assert config.daily_request_limit == 50000
         assert config.log_level == "DEBUG"
         assert config.log_api_requests is True
+        assert config.cache_enabled is False
+        assert config.cache_ttl == 30.0
+        assert config.entity_cache_ttl == 120.0
+        assert config.cache_max_size == 64
+        assert config.user_agent == "OpenAlexMCP/0.1.0 (mailto:test@example.com)"
 
-    @patch.dict('os.environ', {'LOG_API_REQUESTS': 'false'})
-    def test_config_log_api_requests_false(self):
+    def test_config_log_api_requests_false(self, monkeypatch):
         """Test log_api_requests with 'false' value."""
+        monkeypatch.setenv('LOG_API_REQUESTS', 'false')
         config = OpenAlexConfig()
         assert config.log_api_requests is False
 
-    @patch.dict('os.environ', {'LOG_API_REQUESTS': 'TRUE'})
-    def test_config_log_api_requests_case_insensitive(self):
+    def test_config_log_api_requests_case_insensitive(self, monkeypatch):
         """Test log_api_requests is case insensitive."""
+        monkeypatch.setenv('LOG_API_REQUESTS', 'TRUE')
         config = OpenAlexConfig()
         assert config.log_api_requests is True
 
-    def test_validate_success(self):
+    def test_validate_success(self, default_config):
         """Test successful configuration validation."""
-        config = OpenAlexConfig()
+        config = default_config
         # Should not raise any exception
         config.validate()
 
-    def test_validate_negative_timeout(self):
+    def test_validate_negative_timeout(self, default_config):
         """Test validation with negative timeout."""
-        config = OpenAlexConfig()
+        config = default_config
         config.timeout = -1.0
 
         with pytest.raises(ValueError) as exc_info:
@@ -75,9 +125,9 @@ class TestOpenAlexConfig:
 
         assert "OPENALEX_TIMEOUT must be positive" in str(exc_info.value)
 
-    def test_validate_zero_timeout(self):
+    def test_validate_zero_timeout(self, default_config):
         """Test validation with zero timeout."""
-        config = OpenAlexConfig()
+        config = default_config
         config.timeout = 0.0
 
         with pytest.raises(ValueError) as exc_info:
@@ -85,9 +135,9 @@ class TestOpenAlexConfig:
 
         assert "OPENALEX_TIMEOUT must be positive" in str(exc_info.value)
 
-    def test_validate_negative_concurrent_requests(self):
+    def test_validate_negative_concurrent_requests(self, default_config):
         """Test validation with negative concurrent requests."""
-        config = OpenAlexConfig()
+        config = default_config
         config.max_concurrent_requests = -1
 
         with pytest.raises(ValueError) as exc_info:
@@ -95,9 +145,9 @@ class TestOpenAlexConfig:
 
         assert "OPENALEX_MAX_CONCURRENT must be positive" in str(exc_info.value)
 
-    def test_validate_zero_concurrent_requests(self):
+    def test_validate_zero_concurrent_requests(self, default_config):
         """Test validation with zero concurrent requests."""
-        config = OpenAlexConfig()
+        config = default_config
         config.max_concurrent_requests = 0
 
         with pytest.raises(ValueError) as exc_info:
@@ -105,9 +155,29 @@ class TestOpenAlexConfig:
 
         assert "OPENALEX_MAX_CONCURRENT must be positive" in str(exc_info.value)
 
-    def test_validate_zero_default_page_size(self):
+    def test_validate_negative_max_retries(self, default_config):
+        """Test validation with negative retry count."""
+        config = default_config
+        config.max_retries = -1
+
+        with pytest.raises(ValueError) as exc_info:
+            config.validate()
+
+        assert "OPENALEX_MAX_RETRIES must not be negative" in str(exc_info.value)
+
+    def test_validate_negative_retry_backoff(self, default_config):
+        """Test validation with negative retry backoff."""
+        config = default_config
+        config.retry_backoff = -0.5
+
+        with pytest.raises(ValueError) as exc_info:
+            config.validate()
+
+        assert "OPENALEX_RETRY_BACKOFF must not be negative" in str(exc_info.value)
+
+    def test_validate_zero_default_page_size(self, default_config):
         """Test validation with zero default page size."""
-        config = OpenAlexConfig()
+        config = default_config
         config.default_page_size = 0
 
         with pytest.raises(ValueError) as exc_info:
@@ -115,9 +185,9 @@ class TestOpenAlexConfig:
 
         assert "OPENALEX_DEFAULT_PAGE_SIZE must be between 1 and" in str(exc_info.value)
 
-    def test_validate_page_size_exceeds_max(self):
+    def test_validate_page_size_exceeds_max(self, default_config):
         """Test validation with default page size exceeding max."""
-        config = OpenAlexConfig()
+        config = default_config
         config.default_page_size = 300
         config.max_page_size = 200
 
@@ -126,9 +196,9 @@ class TestOpenAlexConfig:
 
         assert "OPENALEX_DEFAULT_PAGE_SIZE must be between 1 and 200" in str(exc_info.value)
 
-    def test_validate_negative_daily_limit(self):
+    def test_validate_negative_daily_limit(self, default_config):
         """Test validation with negative daily limit."""
-        config = OpenAlexConfig()
+        config = default_config
         config.daily_request_limit = -1
 
         with pytest.raises(ValueError) as exc_info:
@@ -136,39 +206,69 @@ class TestOpenAlexConfig:
 
         assert "OPENALEX_DAILY_LIMIT must be positive" in str(exc_info.value)
 
-    def test_get_user_agent_without_email(self):
+    def test_validate_zero_cache_ttl(self, default_config):
+        """Test validation with zero cache TTL."""
+        config = default_config
+        config.cache_ttl = 0
+
+        with pytest.raises(ValueError) as exc_info:
+            config.validate()
+
+        assert "OPENALEX_CACHE_TTL must be positive" in str(exc_info.value)
+
+    def test_validate_zero_entity_cache_ttl(self, default_config):
+        """Test validation with zero entity cache TTL."""
+        config = default_config
+        config.entity_cache_ttl = 0
+
+        with pytest.raises(ValueError) as exc_info:
+            config.validate()
+
+        assert "OPENALEX_ENTITY_CACHE_TTL must be positive" in str(exc_info.value)
+
+    def test_validate_zero_cache_max_size(self, default_config):
+        """Test validation with zero cache size."""
+        config = default_config
+        config.cache_max_size = 0
+
+        with pytest.raises(ValueError) as exc_info:
+            config.validate()
+
+        assert "OPENALEX_CACHE_MAX_SIZE must be positive" in str(exc_info.value)
+
+    def test_get_user_agent_without_email(self, default_config):
         """Test user agent without email."""
-        config = OpenAlexConfig()
+        config = default_config
         config.email = None
 
         user_agent = config.get_user_agent()
         assert user_agent == "OpenAlexMCP/0.1.0"
 
-    def test_get_user_agent_with_email(self):
+    def test_get_user_agent_with_email(self, default_config):
         """Test user agent with email."""
-        config = OpenAlexConfig()
+        config = default_config
         config.email = "test@example.com"
 
         user_agent = config.get_user_agent()
         assert user_agent == "OpenAlexMCP/0.1.0 (mailto:test@example.com)"
 
-    def test_should_use_polite_pool_without_email(self):
+    def test_should_use_polite_pool_without_email(self, default_config):
         """Test polite pool check without email."""
-        config = OpenAlexConfig()
+        config = default_config
         config.email = None
 
         assert config.should_use_polite_pool() is False
 
-    def test_should_use_polite_pool_with_email(self):
+    def test_should_use_polite_pool_with_email(self, default_config):
         """Test polite pool check with email."""
-        config = OpenAlexConfig()
+        config = default_config
         config.email = "test@example.com"
 
         assert config.should_use_polite_pool() is True
 
-    def test_should_use_polite_pool_with_empty_email(self):
+    def test_should_use_polite_pool_with_empty_email(self, default_config):
         """Test polite pool check with empty email."""
-        config = OpenAlexConfig()
+        config = default_config
         config.email = ""
 
         assert config.should_use_polite_pool() is False
@@ -179,49 +279,43 @@ class TestGlobalConfig:
 
     def test_global_config_exists(self):
         """Test that global config instance exists."""
-        from src.openalex_mcp.config import config
-
-        assert config is not None
-        assert isinstance(config, OpenAlexConfig)
+        assert global_config is not None
+        assert isinstance(global_config, OpenAlexConfig)
 
     def test_global_config_validation(self):
         """Test that global config is valid."""
-        from src.openalex_mcp.config import config
-
         # Should not raise any exception
-        config.validate()
+        global_config.validate()
 
 
 class TestConfigEnvironmentVariableParsing:
     """Test parsing of different environment variable types."""
 
-    @patch.dict('os.environ', {'OPENALEX_TIMEOUT': 'invalid'})
-    def test_invalid_float_environment_variable(self):
-        """Test handling of invalid float environment variable."""
-        with pytest.raises(ValueError):
-            OpenAlexConfig()
-
-    @patch.dict('os.environ', {'OPENALEX_MAX_CONCURRENT': 'invalid'})
-    def test_invalid_int_environment_variable(self):
-        """Test handling of invalid integer environment variable."""
+    @pytest.mark.parametrize("name", [
+        'OPENALEX_TIMEOUT',  # float
+        'OPENALEX_MAX_CONCURRENT',  # int
+    ])
+    def test_invalid_numeric_environment_variable(self, monkeypatch, name):
+        """Test handling of invalid numeric environment variables."""
+        monkeypatch.setenv(name, 'invalid')
         with pytest.raises(ValueError):
             OpenAlexConfig()
 
-    @patch.dict('os.environ', {'LOG_API_REQUESTS': 'invalid'})
-    def test_invalid_boolean_environment_variable(self):
+    def test_invalid_boolean_environment_variable(self, monkeypatch):
         """Test handling of invalid boolean environment variable."""
+        monkeypatch.setenv('LOG_API_REQUESTS', 'invalid')
         config = OpenAlexConfig()
         # Should default to False for any value other than 'true' (case insensitive)
         assert config.log_api_requests is False
 
-    @patch.dict('os.environ', {'OPENALEX_TIMEOUT': '45.5'})
-    def test_float_environment_variable_parsing(self):
+    def test_float_environment_variable_parsing(self, monkeypatch):
         """Test parsing of float environment variable."""
+        monkeypatch.setenv('OPENALEX_TIMEOUT', '45.5')
         config = OpenAlexConfig()
         assert config.timeout == 45.5
 
-    @patch.dict('os.environ', {'OPENALEX_MAX_CONCURRENT': '15'})
-    def test_int_environment_variable_parsing(self):
+    def test_int_environment_variable_parsing(self, monkeypatch):
         """Test parsing of integer environment variable."""
+        monkeypatch.setenv('OPENALEX_MAX_CONCURRENT', '15')
         config = OpenAlexConfig()
         assert config.max_concurrent_requests == 15
@@ -1,118 +1,100 @@
 """Integration tests (requires network access)."""
 
+import asyncio
 import os
+import re
+from unittest.mock import patch
 
+import httpx
 import pytest
+import pytest_asyncio
 
-from src.openalex_mcp.client import OpenAlexClient
-from src.openalex_mcp.tools import search_authors, search_works
+from src.openalex_mcp.client import OpenAlexClient, aclose_shared
+from src.openalex_mcp.config import OpenAlexConfig, config
+from src.openalex_mcp.tools import get_work_details, search_authors, search_works
 
+# Live results vary, so the real API tests accept either results or an error message
+_WORKS_PATTERN = re.compile(r"attention|works|found|error", re.IGNORECASE)
+_AUTHORS_PATTERN = re.compile(r"hinton|found|authors|error", re.IGNORECASE)
+_ERROR_PATTERN = re.compile(r"not found|error", re.IGNORECASE)
 
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_client():
+    """One OpenAlexClient opened for all the real API tests in this module."""
+    # Use no email to avoid 400 "Invalid" errors with fake emails
+    async with OpenAlexClient() as client:
+        yield client
+    await aclose_shared()
+
+
+@pytest.mark.skipif(
+    not os.getenv("OPENALEX_RUN_REMOTE"),
+    reason="set OPENALEX_RUN_REMOTE=1 to run against the real OpenAlex API",
+)
+# One worker, so the rate-limited API sees a single client
+@pytest.mark.xdist_group(name="openalex_remote")
 class TestRealAPIIntegration:
     """Integration tests against the real OpenAlex API.
     
     These tests are marked as 'slow' and 'integration' and require network access.
-    They can be skipped by running: pytest -m "not slow and not integration"
+    They only run when OPENALEX_RUN_REMOTE is set (as make test-integration does).
     """
 
     @pytest.mark.slow
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_real_search_works(self):
+    async def test_real_search_works(self, shared_client):
         """Test real API call to search works."""
-        # Skip if running in CI without API access
-        if os.getenv("SKIP_INTEGRATION_TESTS"):
-            pytest.skip("Integration tests disabled")
-
-        # Use no email to avoid 400 "Invalid" errors with fake emails
-        client = OpenAlexClient()
-
         arguments = {
             "query": "attention is all you need",
             "limit": 3
         }
 
-        async with client:
-            results = await search_works(client, arguments)
-
-        assert len(results) == 1
+        result = await search_works(shared_client, **arguments)
         # Should either find results or get an error message
-        assert any(phrase in results[0].text.lower() for phrase in ["attention", "works", "found", "error"])
+        assert _WORKS_PATTERN.search(result)
 
     @pytest.mark.slow
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_real_search_authors(self):
+    async def test_real_search_authors(self, shared_client):
         """Test real API call to search authors."""
-        if os.getenv("SKIP_INTEGRATION_TESTS"):
-            pytest.skip("Integration tests disabled")
-
-        # Use no email to avoid 400 "Invalid" errors with fake emails
-        client = OpenAlexClient()
-
         arguments = {
             "query": "Geoffrey Hinton",
             "limit": 2
         }
 
-        async with client:
-            results = await search_authors(client, arguments)
-
-        assert len(results) == 1
+        result = await search_authors(shared_client, **arguments)
         # Should either find results or get an error message
-        assert any(phrase in results[0].text.lower() for phrase in ["hinton", "found", "authors", "error"])
+        assert _AUTHORS_PATTERN.search(result)
 
     @pytest.mark.slow
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_real_api_rate_limiting(self):
+    async def test_real_api_rate_limiting(self, shared_client):
         """Test that rate limiting works with real API."""
-        if os.getenv("SKIP_INTEGRATION_TESTS"):
-            pytest.skip("Integration tests disabled")
-
-        # Use no email to avoid 400 "Invalid" errors with fake emails
-        client = OpenAlexClient()
-
-        # Make multiple concurrent requests
-        import asyncio
-
-        async def make_request():
-            arguments = {"query": "machine learning", "limit": 1}
-            async with client:
-                return await search_works(client, arguments)
-
-        # Create multiple tasks
-        tasks = [make_request() for _ in range(5)]
+        arguments = {"query": "machine learning", "limit": 1}
 
-        # This should complete without errors due to rate limiting
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Make multiple concurrent requests; the shared connection pool limits
+        # how many reach the API at once
+        results = await asyncio.gather(
+            *(search_works(shared_client, **arguments) for _ in range(5)),
+            return_exceptions=True,
+        )
 
         # All requests should complete (may have exceptions due to API limits but no network errors)
         assert len(results) == 5
 
     @pytest.mark.slow
     @pytest.mark.integration
-    @pytest.mark.asyncio
-    async def test_real_api_error_handling(self):
+    async def test_real_api_error_handling(self, shared_client):
         """Test error handling with real API."""
-        if os.getenv("SKIP_INTEGRATION_TESTS"):
-            pytest.skip("Integration tests disabled")
-
-        # Use no email to avoid 400 "Invalid" errors with fake emails
-        client = OpenAlexClient()
-
         # Test with invalid work ID
-        from src.openalex_mcp.tools import get_work_details
-
         arguments = {"work_id": "W999999999999999"}
 
-        async with client:
-            results = await get_work_details(client, arguments)
+        result = await get_work_details(shared_client, **arguments)
 
         # Should handle the error gracefully
-        assert len(results) == 1
         # Either "not found" or some other error message
-        assert any(phrase in results[0].text.lower() for phrase in ["not found", "error"])
+        assert _ERROR_PATTERN.search(result)
 
 
 class TestMockAPIIntegration:
@@ -121,36 +103,64 @@ class TestMockAPIIntegration:
     These tests verify the full flow without network calls.
     """
 
-    @pytest.mark.asyncio
     async def test_full_pipeline_with_mocks(self):
-        """Test the full pipeline with mocked components."""
-        from unittest.mock import AsyncMock
-
-        from src.openalex_mcp.tools import search_works
-
-        # Create a mock client
-        mock_client = AsyncMock()
-        mock_response = {
-            "meta": {"count": 1},
-            "results": [{
-                "id": "W123",
-                "title": "Test Work",
-                "authorships": [],
-                "topics": [],
-                "primary_location": None,
-                "publication_year": 2023,
-                "cited_by_count": 5
-            }]
-        }
-        mock_client.get_works.return_value = mock_response
+        """Test the full pipeline from tool to HTTP request with a mock transport."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={
+                "meta": {"count": 1},
+                "results": [{
+                    "id": "W123",
+                    "title": "Test Work",
+                    "authorships": [],
+                    "topics": [],
+                    "primary_location": None,
+                    "publication_year": 2023,
+                    "cited_by_count": 5
+                }]
+            })
 
+        client = OpenAlexClient()
         arguments = {"query": "test"}
 
-        results = await search_works(mock_client, arguments)
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client._client = http_client
+            result = await search_works(client, **arguments)
+
+        assert "Test Work" in result
+        assert len(requests) == 1
+        assert requests[0].url.path == "/works"
+        assert requests[0].url.params["search"] == "test"
+
+    async def test_concurrent_searches_with_mock_transport(self, sample_work_data):
+        """Test concurrent searches through the real httpx client, offline."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)  # Simulated API latency
+            in_flight -= 1
+            payload = {"meta": {"count": 1}, "results": [sample_work_data]}
+            return httpx.Response(200, json=payload)
+
+        client = OpenAlexClient()
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client._client = http_client
+            results = await asyncio.gather(*(
+                search_works(client, query=f"machine learning {i}", limit=1)
+                for i in range(5)
+            ))
 
-        assert len(results) == 1
-        assert "Test Work" in results[0].text
-        mock_client.get_works.assert_called_once()
+        assert all(sample_work_data["title"] in result for result in results)
+        # The requests ran concurrently rather than one after another
+        assert max_in_flight > 1
 
 
 class TestConfigurationIntegration:
@@ -158,8 +168,6 @@ class TestConfigurationIntegration:
 
     def test_config_used_by_client(self):
         """Test that client uses configuration."""
-        from src.openalex_mcp.config import config
-
         # Temporarily modify config
         original_timeout = config.timeout
         config.timeout = 99.0
@@ -174,8 +182,6 @@ class TestConfigurationIntegration:
 
     def test_config_validation_integration(self):
         """Test that configuration validation works in practice."""
-        from src.openalex_mcp.config import OpenAlexConfig
-
         config = OpenAlexConfig()
         config.timeout = -1
 
@@ -186,16 +192,12 @@ class TestConfigurationIntegration:
 class TestErrorHandlingIntegration:
     """Test error handling across the entire system."""
 
-    @pytest.mark.asyncio
     async def test_network_error_propagation(self):
         """Test that network errors are properly handled."""
-        from unittest.mock import patch
-
-        import httpx
-
         client = OpenAlexClient()
 
-        with patch.object(client, '_client') as mock_client:
+        with patch.object(client, '_client') as mock_client, \
+                patch('src.openalex_mcp.client.config.retry_backoff', 0):
             mock_client.get.side_effect = httpx.RequestError("Network error")
 
             with pytest.raises(Exception) as exc_info:
@@ -203,16 +205,19 @@ class TestErrorHandlingIntegration:
 
             assert "Request failed" in str(exc_info.value)
 
-    @pytest.mark.asyncio
     async def test_server_error_handling_integration(self):
-        """Test server-level error handling."""
-        from unittest.mock import AsyncMock, patch
+        """Test that a tool reports network failures as an error message."""
+        def handler(request):
+            raise httpx.ConnectError("Network error", request=request)
 
-        from src.openalex_mcp.tools import search_works
-        client = AsyncMock()
+        client = OpenAlexClient()
         arguments = {"query": "test"}
-        with patch('src.openalex_mcp.tools.search_works', side_effect=Exception("Test error")):
-            try:
-                await search_works(client, arguments)
-            except Exception as e:
-                assert "Test error" in str(e)
+
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client._client = http_client
+            with patch('src.openalex_mcp.client.config.retry_backoff', 0):
+                result = await search_works(client, **arguments)
+
+        assert result.startswith("Error searching works:")
+        assert "Network error" in result
@@ -1,10 +1,34 @@
 """Tests for logging configuration."""
 
 import logging
+import subprocess
+import sys
 from unittest.mock import patch
 
+import pytest
+
+from src.openalex_mcp.logutil import logger as default_logger
 from src.openalex_mcp.logutil import setup_logging
 
+# These tests reconfigure shared named loggers, so keep them on one xdist worker
+pytestmark = pytest.mark.xdist_group(name="logging")
+
+
+@pytest.fixture
+def propagating_logger():
+    """Build loggers with setup_logging() that propagate to caplog during the test."""
+    loggers = []
+
+    def make(name):
+        logger = setup_logging(name)
+        logger.propagate = True
+        loggers.append(logger)
+        return logger
+
+    yield make
+    for logger in loggers:
+        logger.propagate = False
+
 
 class TestLoggingSetup:
     """Test logging setup functionality."""
@@ -25,33 +49,19 @@ class TestLoggingSetup:
 
         assert logger.name == "custom_logger"
 
+    @pytest.mark.parametrize("log_level, expected", [
+        ("DEBUG", logging.DEBUG),
+        ("WARNING", logging.WARNING),
+        ("INVALID_LEVEL", logging.INFO),  # Invalid levels default to INFO
+    ])
     @patch('src.openalex_mcp.logutil.config')
-    def test_setup_logging_debug_level(self, mock_config):
-        """Test logging setup with DEBUG level."""
-        mock_config.log_level = "DEBUG"
-
-        logger = setup_logging()
-
-        assert logger.level == logging.DEBUG
-
-    @patch('src.openalex_mcp.logutil.config')
-    def test_setup_logging_warning_level(self, mock_config):
-        """Test logging setup with WARNING level."""
-        mock_config.log_level = "WARNING"
-
-        logger = setup_logging()
-
-        assert logger.level == logging.WARNING
-
-    @patch('src.openalex_mcp.logutil.config')
-    def test_setup_logging_invalid_level(self, mock_config):
-        """Test logging setup with invalid level defaults to INFO."""
-        mock_config.log_level = "INVALID_LEVEL"
+    def test_setup_logging_level(self, mock_config, log_level, expected):
+        """Test logging setup with the configured level."""
+        mock_config.log_level = log_level
 
         logger = setup_logging()
 
-        # Should default to INFO for invalid level
-        assert logger.level == logging.INFO
+        assert logger.level == expected
 
     def test_logger_no_propagation(self):
         """Test that logger doesn't propagate to root logger."""
@@ -65,28 +75,20 @@ class TestLoggingSetup:
         handler = logger.handlers[0]
         assert isinstance(handler, logging.StreamHandler)
         # Check it's using stderr (for MCP compatibility)
-        import sys
         assert handler.stream is sys.stderr
-        formatter = handler.formatter
-        assert formatter is not None
-        fmt = getattr(formatter, '_fmt', None)
-        assert fmt is not None
-        assert 'asctime' in fmt
-        assert 'name' in fmt
-        assert 'levelname' in fmt
-        assert 'message' in fmt
+        expected = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+        assert handler.formatter._fmt == expected
 
     def test_logger_clears_existing_handlers(self):
-        """Test that setup clears existing handlers."""
-        # First setup
-        logger1 = setup_logging("test_clear")
-        initial_handler_count = len(logger1.handlers)
+        """Test that setup replaces existing handlers rather than adding more."""
+        logger = setup_logging("test_clear")
+        initial_handlers = list(logger.handlers)
 
         # Second setup should clear and recreate
-        logger2 = setup_logging("test_clear")
+        assert setup_logging("test_clear") is logger  # Same logger instance
 
-        assert len(logger2.handlers) == initial_handler_count
-        assert logger1 is logger2  # Same logger instance
+        assert len(logger.handlers) == len(initial_handlers)
+        assert logger.handlers[0] is not initial_handlers[0]
 
     def test_multiple_logger_instances(self):
         """Test creating multiple logger instances."""
@@ -103,103 +105,94 @@ class TestDefaultLogger:
 
     def test_default_logger_exists(self):
         """Test that default logger instance exists."""
-        from src.openalex_mcp.logutil import logger
-
-        assert logger is not None
-        assert isinstance(logger, logging.Logger)
-        assert logger.name == "openalex_mcp"
+        assert default_logger is not None
+        assert isinstance(default_logger, logging.Logger)
+        assert default_logger.name == "openalex_mcp"
 
     def test_default_logger_level(self):
-        """Test default logger level."""
-        from src.openalex_mcp.logutil import logger
-
+        """Test default logger level once configured."""
+        # setup_logging configures the same module-level logger
+        assert setup_logging() is default_logger
         # Should be INFO by default
-        assert logger.level == logging.INFO
+        assert default_logger.level == logging.INFO
 
     def test_default_logger_handlers(self):
-        """Test default logger has handlers."""
-        from src.openalex_mcp.logutil import logger
+        """Test default logger has handlers once configured."""
+        setup_logging()
 
-        assert len(logger.handlers) > 0
-        assert isinstance(logger.handlers[0], logging.StreamHandler)
+        assert len(default_logger.handlers) > 0
+        assert isinstance(default_logger.handlers[0], logging.StreamHandler)
+
+    def test_import_does_not_configure_logging(self):
+        """Test that importing the package leaves logging unconfigured."""
+        code = (
+            "import logging, openalex_mcp.client; "
+            "print(len(logging.getLogger('openalex_mcp').handlers))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "0"
 
 
 class TestLoggerFunctionality:
     """Test actual logging functionality."""
 
-    def test_logger_log_messages(self, caplog):
+    def test_logger_log_messages(self, propagating_logger, caplog):
         """Test that logger actually logs messages."""
-        # Enable propagation temporarily for testing
-        logger = setup_logging("test_logging")
-        logger.propagate = True
-        try:
-            with caplog.at_level(logging.INFO, logger="test_logging"):
-                logger.info("Test info message")
-                logger.warning("Test warning message")
-                logger.error("Test error message")
-            # Use 'in' checks for log output
-            assert any("Test info message" in r.message for r in caplog.records)
-            assert any("Test warning message" in r.message for r in caplog.records)
-            assert any("Test error message" in r.message for r in caplog.records)
-        finally:
-            logger.propagate = False
-
-    def test_logger_debug_not_shown_at_info_level(self, caplog):
+        logger = propagating_logger("test_logging")
+        with caplog.at_level(logging.INFO, logger="test_logging"):
+            logger.info("Test info message")
+            logger.warning("Test warning message")
+            logger.error("Test error message")
+        # Use 'in' checks for log output
+        assert any("Test info message" in r.message for r in caplog.records)
+        assert any("Test warning message" in r.message for r in caplog.records)
+        assert any("Test error message" in r.message for r in caplog.records)
+
+    def test_logger_debug_not_shown_at_info_level(self, propagating_logger, caplog):
         """Test that debug messages aren't shown at INFO level."""
-        logger = setup_logging("test_debug")
+        logger = propagating_logger("test_debug")
         logger.setLevel(logging.INFO)
-        logger.propagate = True
-        try:
-            with caplog.at_level(logging.INFO, logger="test_debug"):
-                logger.debug("Debug message")
-                logger.info("Info message")
-            assert not any("Debug message" in r.message for r in caplog.records)
-            assert any("Info message" in r.message for r in caplog.records)
-        finally:
-            logger.propagate = False
+        with caplog.at_level(logging.INFO, logger="test_debug"):
+            logger.debug("Debug message")
+            logger.info("Info message")
+        assert not any("Debug message" in r.message for r in caplog.records)
+        assert any("Info message" in r.message for r in caplog.records)
 
     @patch('src.openalex_mcp.logutil.config')
-    def test_logger_debug_shown_at_debug_level(self, mock_config, caplog):
+    def test_logger_debug_shown_at_debug_level(
+        self, mock_config, propagating_logger, caplog
+    ):
         """Test that debug messages are shown at DEBUG level."""
         mock_config.log_level = "DEBUG"
-        logger = setup_logging("test_debug_level")
-        logger.propagate = True
-        try:
-            with caplog.at_level(logging.DEBUG, logger="test_debug_level"):
-                logger.debug("Debug message")
-                logger.info("Info message")
-            assert any("Debug message" in r.message for r in caplog.records)
-            assert any("Info message" in r.message for r in caplog.records)
-        finally:
-            logger.propagate = False
+        logger = propagating_logger("test_debug_level")
+        with caplog.at_level(logging.DEBUG, logger="test_debug_level"):
+            logger.debug("Debug message")
+            logger.info("Info message")
+        assert any("Debug message" in r.message for r in caplog.records)
+        assert any("Info message" in r.message for r in caplog.records)
 
 
 class TestLoggerFormat:
     """Test logger message formatting."""
 
-    def test_log_message_format(self, caplog):
+    def test_log_message_format(self, propagating_logger, caplog):
         """Test log message contains all expected parts."""
-        logger = setup_logging("format_test")
-        logger.propagate = True
-        try:
-            with caplog.at_level(logging.INFO, logger="format_test"):
-                logger.info("Test message")
-            log_record = caplog.records[0]
-            assert log_record.name == "format_test"
-            assert log_record.levelname == "INFO"
-            assert log_record.message == "Test message"
-            assert hasattr(log_record, 'created')
-        finally:
-            logger.propagate = False
-
-    def test_log_message_formatting_in_output(self, caplog):
+        logger = propagating_logger("format_test")
+        with caplog.at_level(logging.INFO, logger="format_test"):
+            logger.info("Test message")
+        log_record = caplog.records[0]
+        assert log_record.name == "format_test"
+        assert log_record.levelname == "INFO"
+        assert log_record.message == "Test message"
+        assert hasattr(log_record, 'created')
+
+    def test_log_message_formatting_in_output(self, propagating_logger, caplog):
         """Test that formatted message contains expected elements."""
-        logger = setup_logging("format_output_test")
-        logger.propagate = True
-        try:
-            with caplog.at_level(logging.WARNING, logger="format_output_test"):
-                logger.warning("Warning message")
-            formatted_output = caplog.text
-            assert "Warning message" in formatted_output
-        finally:
-            logger.propagate = False
+        logger = propagating_logger("format_output_test")
+        with caplog.at_level(logging.WARNING, logger="format_output_test"):
+            logger.warning("Warning message")
+        formatted_output = caplog.text
+        assert "Warning message" in formatted_output
@@ -16,6 +16,12 @@ from src.openalex_mcp.models import (
 )
 
 
+@pytest.fixture(scope="session")
+def sample_work(sample_work_data):
+    """Work validated once from the sample data, for tests that only read it."""
+    return Work(**sample_work_data)
+
+
 class TestBasicModels:
     """Test basic model components."""
 
@@ -66,18 +72,29 @@ class TestBasicModels:
         assert topic.score == 0.95
 
 
-class TestWorkModel:
-    """Test the Work model."""
+class TestMinimalModels:
+    """Test the entity models with only an ID."""
 
-    def test_work_creation_minimal(self):
-        """Test Work creation with minimal required fields."""
-        work = Work(id="https://openalex.org/W123")
+    @pytest.mark.parametrize("model, entity_id, none_fields, list_fields", [
+        (Work, "W123", ["doi", "title"], ["authorships", "topics"]),
+        (Author, "A123", ["display_name", "works_count"], ["affiliations"]),
+        (InstitutionModel, "I123", ["display_name", "works_count"], []),
+        (SourceModel, "S123", ["display_name", "issn"], []),
+        (TopicModel, "T123", ["display_name"], ["keywords"]),
+    ])
+    def test_creation_minimal(self, model, entity_id, none_fields, list_fields):
+        """Test model creation with only the required ID field."""
+        instance = model(id=f"https://openalex.org/{entity_id}")
 
-        assert work.id == "https://openalex.org/W123"
-        assert work.doi is None
-        assert work.title is None
-        assert work.authorships == []
-        assert work.topics == []
+        assert instance.id == f"https://openalex.org/{entity_id}"
+        for field in none_fields:
+            assert getattr(instance, field) is None
+        for field in list_fields:
+            assert getattr(instance, field) == []
+
+
+class TestWorkModel:
+    """Test the Work model."""
 
     def test_work_creation_full(self, sample_work_data):
         """Test Work creation with full data."""
@@ -90,23 +107,20 @@ class TestWorkModel:
         assert len(work.authorships) == len(sample_work_data["authorships"])
         assert len(work.topics) == len(sample_work_data["topics"])
 
-    def test_work_authorship_nested(self, sample_work_data):
+    def test_work_authorship_nested(self, sample_work):
         """Test Work with nested authorship data."""
-        work = Work(**sample_work_data)
-
-        authorship = work.authorships[0]
+        authorship = sample_work.authorships[0]
         assert authorship.author_position == "first"
         assert authorship.author.display_name == "Ashish Vaswani"
         assert len(authorship.institutions) == 1
         assert authorship.institutions[0].display_name == "Google"
 
-    def test_work_primary_location(self, sample_work_data):
+    def test_work_primary_location(self, sample_work):
         """Test Work with primary location data."""
-        work = Work(**sample_work_data)
-
-        assert work.primary_location is not None
-        assert work.primary_location.source.display_name == "arXiv (Cornell University)"
-        assert work.primary_location.is_oa is True
+        assert sample_work.primary_location is not None
+        source = sample_work.primary_location.source
+        assert source.display_name == "arXiv (Cornell University)"
+        assert sample_work.primary_location.is_oa is True
 
     def test_work_invalid_id(self):
         """Test Work creation with invalid ID type."""
@@ -117,15 +131,6 @@ class TestWorkModel:
 class TestAuthorModel:
     """Test the Author model."""
 
-    def test_author_creation_minimal(self):
-        """Test Author creation with minimal required fields."""
-        author = Author(id="https://openalex.org/A123")
-
-        assert author.id == "https://openalex.org/A123"
-        assert author.display_name is None
-        assert author.works_count is None
-        assert author.affiliations == []
-
     def test_author_creation_full(self, sample_author_data):
         """Test Author creation with full data."""
         author = Author(**sample_author_data)
@@ -148,14 +153,6 @@ class TestAuthorModel:
 class TestInstitutionModel:
     """Test the InstitutionModel."""
 
-    def test_institution_creation_minimal(self):
-        """Test Institution creation with minimal required fields."""
-        institution = InstitutionModel(id="https://openalex.org/I123")
-
-        assert institution.id == "https://openalex.org/I123"
-        assert institution.display_name is None
-        assert institution.works_count is None
-
     def test_institution_creation_full(self, sample_institution_data):
         """Test Institution creation with full data."""
         institution = InstitutionModel(**sample_institution_data)
@@ -169,14 +166,6 @@ class TestInstitutionModel:
 class TestSourceModel:
     """Test the SourceModel."""
 
-    def test_source_creation_minimal(self):
-        """Test Source creation with minimal required fields."""
-        source = SourceModel(id="https://openalex.org/S123")
-
-        assert source.id == "https://openalex.org/S123"
-        assert source.display_name is None
-        assert source.issn is None
-
     def test_source_creation_full(self, sample_source_data):
         """Test Source creation with full data."""
         source = SourceModel(**sample_source_data)
@@ -190,14 +179,6 @@ class TestSourceModel:
 class TestTopicModel:
     """Test the TopicModel."""
 
-    def test_topic_creation_minimal(self):
-        """Test Topic creation with minimal required fields."""
-        topic = TopicModel(id="https://openalex.org/T123")
-
-        assert topic.id == "https://openalex.org/T123"
-        assert topic.display_name is None
-        assert topic.keywords == []
-
     def test_topic_creation_with_hierarchy(self):
         """Test Topic creation with hierarchical data."""
         topic_data = {
@@ -282,6 +263,19 @@ class TestModelValidation:
         # Pydantic should convert string to int if possible
         # This specific case might pass depending on the string content
 
+    def test_models_are_frozen(self):
+        """Test that parsed models cannot be modified."""
+        work = Work(id="W123", title="Original")
+
+        with pytest.raises(ValidationError):
+            work.title = "Changed"
+
+    def test_models_ignore_unknown_fields(self):
+        """Test that fields not declared on a model are dropped."""
+        work = Work(id="W123", not_a_field="ignored")
+
+        assert not hasattr(work, "not_a_field")
+
     def test_search_response_invalid_structure(self):
         """Test SearchResponse with invalid structure."""
         with pytest.raises(ValidationError):
@@ -1,161 +1,237 @@
 """Tests for the OpenAlex MCP FastMCP server."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import json
+from unittest.mock import patch
 
 import pytest
 
-from src.openalex_mcp.server import mcp
-
-
-@pytest.mark.asyncio
-async def test_list_tools():
+from src.openalex_mcp import server
+from src.openalex_mcp.client import OpenAlexClient, get_shared_client
+from src.openalex_mcp.server import (
+    OpenAlex_batch_search,
+    OpenAlex_get_author_profile,
+    OpenAlex_get_citations,
+    OpenAlex_get_work_details,
+    OpenAlex_search_authors,
+    OpenAlex_search_institutions,
+    OpenAlex_search_sources,
+    OpenAlex_search_works,
+    mcp,
+)
+
+EXPECTED_TOOLS = frozenset({
+    "OpenAlex_search_works",
+    "OpenAlex_search_authors",
+    "OpenAlex_search_institutions",
+    "OpenAlex_search_sources",
+    "OpenAlex_get_work_details",
+    "OpenAlex_get_author_profile",
+    "OpenAlex_get_citations",
+    "OpenAlex_download_paper",
+    "OpenAlex_batch_search",
+})
+
+
+def test_list_tools(tool_list):
     """Test that all expected tools are registered."""
-    tools = await mcp.list_tools()
-    assert len(tools) == 8
-
-    tool_names = [tool.name for tool in tools]
-    expected_tools = [
-        "OpenAlex_search_works",
-        "OpenAlex_search_authors",
-        "OpenAlex_search_institutions",
-        "OpenAlex_search_sources",
-        "OpenAlex_get_work_details",
-        "OpenAlex_get_author_profile",
-        "OpenAlex_get_citations",
-        "OpenAlex_download_paper"
+    assert len(tool_list) == len(EXPECTED_TOOLS)
+
+    missing = EXPECTED_TOOLS - {tool.name for tool in tool_list}
+    assert not missing, f"missing tools: {sorted(missing)}"
+
+
+@pytest.mark.parametrize("wrapper, tool_name, args, kwargs", [
+    (OpenAlex_search_works, "search_works", ("machine learning",), {"limit": 5}),
+    (OpenAlex_search_authors, "search_authors", ("John Doe",), {"limit": 5}),
+    (
+        OpenAlex_search_institutions, "search_institutions",
+        ("Stanford",), {"country": "US"},
+    ),
+    (
+        OpenAlex_search_sources, "search_sources",
+        ("Nature",), {"source_type": "journal"},
+    ),
+    (OpenAlex_get_work_details, "get_work_details", ("W123456789",), {}),
+    (OpenAlex_get_author_profile, "get_author_profile", ("A123456789",), {}),
+    (
+        OpenAlex_get_citations, "get_citations",
+        ("W123456789",), {"sort": "cited_by_count"},
+    ),
+])
+async def test_tool_wrapper(wrapper, tool_name, args, kwargs, patch_tool):
+    """Test that each MCP tool wrapper returns its tool function's result."""
+    mock_tool = patch_tool(tool_name)
+    mock_tool.return_value = f"Mock {tool_name} result"
+
+    result = await wrapper(*args, **kwargs)
+
+    assert result == f"Mock {tool_name} result"
+    mock_tool.assert_awaited_once()
+
+
+async def test_tools_share_one_client(patch_tool):
+    """Test that tool calls reuse a single OpenAlexClient."""
+    mock_search = patch_tool("search_works")
+    mock_get = patch_tool("get_work_details")
+    mock_search.return_value = "Mock search result"
+    mock_get.return_value = "Mock work details"
+
+    await OpenAlex_search_works("machine learning")
+    await OpenAlex_get_work_details("W123456789")
+
+    search_client = mock_search.await_args.args[0]
+    details_client = mock_get.await_args.args[0]
+    assert search_client is details_client
+
+
+async def test_lifespan_releases_client():
+    """Test that the lifespan starts the shared client and drops it on shutdown."""
+    async with server.lifespan(mcp):
+        client = server._client
+        assert client is not None
+        assert client._client is not None
+        assert await server._get_client() is client
+
+    assert server._client is None
+
+
+async def test_get_client_reattaches_to_current_shared_client(monkeypatch):
+    """Test that the cached client is moved off an httpx client from an old loop."""
+    cached = OpenAlexClient()
+    stale = object()
+    cached._client = stale
+    monkeypatch.setattr(server, "_client", cached)
+
+    client = await server._get_client()
+
+    assert client is cached
+    assert client._client is not stale
+    assert client._client is get_shared_client()
+
+
+async def test_identical_concurrent_calls_share_one_execution(patch_tool):
+    """Test that concurrent identical tool calls run the tool once."""
+    async def slow_details(client, **arguments):
+        await asyncio.sleep(0.01)
+        return "Mock work details"
+
+    mock_get = patch_tool("get_work_details")
+    mock_get.side_effect = slow_details
+
+    results = await asyncio.gather(
+        OpenAlex_get_work_details("W123456789"),
+        OpenAlex_get_work_details("W123456789"),
+        OpenAlex_get_work_details("W987654321"),
+    )
+
+    assert results == ["Mock work details"] * 3
+    assert mock_get.await_count == 2
+    assert not server._inflight
+
+
+async def test_batch_search_tool(patch_tool):
+    """Test that batch search runs each distinct query once and reports errors."""
+    mock_search = patch_tool("search_works")
+    mock_get = patch_tool("get_work_details")
+    mock_search.return_value = "Mock search result"
+    mock_get.side_effect = Exception("Test error")
+
+    result = await OpenAlex_batch_search([
+        {"tool": "OpenAlex_search_works", "query": "machine learning", "limit": 5},
+        {"tool": "OpenAlex_get_work_details", "work_id": "W123456789"},
+        {"tool": "OpenAlex_search_works", "query": "machine learning", "limit": 5},
+        {"tool": "OpenAlex_download_paper", "work_id": "W123456789"},
+    ])
+
+    results = json.loads(result)
+    assert results[0] == {
+        "tool": "OpenAlex_search_works",
+        "result": "Mock search result",
+    }
+    assert results[1] == {"tool": "OpenAlex_get_work_details", "error": "Test error"}
+    assert results[2] == results[0]
+    assert "Unknown tool" in results[3]["error"]
+    mock_search.assert_awaited_once()
+
+
+@pytest.mark.parametrize("query, error", [
+    (
+        {"tool": "OpenAlex_search_works", "qurey": "x"},
+        "Invalid arguments for OpenAlex_search_works: "
+        "query: Missing required argument; qurey: Unexpected keyword argument",
+    ),
+    (
+        {"tool": "OpenAlex_search_works", "query": "x", "limit": "many"},
+        "Invalid arguments for OpenAlex_search_works: "
+        "limit: Input should be a valid integer",
+    ),
+    ({"query": "x"}, 'Query has no "tool" key'),
+])
+async def test_batch_search_reports_malformed_queries(patch_tool, query, error):
+    """Test that batch queries are validated like direct tool calls."""
+    mock_search = patch_tool("search_works")
+
+    results = json.loads(await OpenAlex_batch_search([query]))
+
+    assert results[0]["error"].startswith(error)
+    mock_search.assert_not_awaited()
+
+
+async def test_batch_search_rejects_oversized_batch(patch_tool):
+    """Test that batch search refuses more queries than it allows per call."""
+    mock_search = patch_tool("search_works")
+    queries = [
+        {"tool": "OpenAlex_search_works", "query": f"topic {i}"}
+        for i in range(server._MAX_BATCH_QUERIES + 1)
     ]
 
-    for expected_tool in expected_tools:
-        assert expected_tool in tool_names
-
-
-@pytest.mark.asyncio
-async def test_search_works_tool():
-    """Test search_works_tool function."""
-    with patch('src.openalex_mcp.server.search_works', new_callable=AsyncMock) as mock_search:
-        from src.openalex_mcp.server import OpenAlex_search_works
-
-        # Mock the search_works function to return expected format
-        mock_search.return_value = [MagicMock(text="Mock search result")]
-
-        result = await OpenAlex_search_works("machine learning", limit=5)
-
-        assert result == "Mock search result"
-        mock_search.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_search_authors_tool():
-    """Test search_authors_tool function."""
-    with patch('src.openalex_mcp.server.search_authors', new_callable=AsyncMock) as mock_search:
-        from src.openalex_mcp.server import OpenAlex_search_authors
-
-        mock_search.return_value = [MagicMock(text="Mock author result")]
-
-        result = await OpenAlex_search_authors("John Doe", limit=5)
-
-        assert result == "Mock author result"
-        mock_search.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_search_institutions_tool():
-    """Test search_institutions_tool function."""
-    with patch('src.openalex_mcp.server.search_institutions', new_callable=AsyncMock) as mock_search:
-        from src.openalex_mcp.server import OpenAlex_search_institutions
-
-        mock_search.return_value = [MagicMock(text="Mock institution result")]
-
-        result = await OpenAlex_search_institutions("Stanford", country="US")
-
-        assert result == "Mock institution result"
-        mock_search.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_search_sources_tool():
-    """Test search_sources_tool function."""
-    with patch('src.openalex_mcp.server.search_sources', new_callable=AsyncMock) as mock_search:
-        from src.openalex_mcp.server import OpenAlex_search_sources
+    result = await OpenAlex_batch_search(queries)
 
-        mock_search.return_value = [MagicMock(text="Mock source result")]
+    assert result.startswith("Error running batch search:")
+    assert f"at most {server._MAX_BATCH_QUERIES} queries" in result
+    mock_search.assert_not_awaited()
 
-        result = await OpenAlex_search_sources("Nature", source_type="journal")
 
-        assert result == "Mock source result"
-        mock_search.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_get_work_details_tool():
-    """Test get_work_details_tool function."""
-    with patch('src.openalex_mcp.server.get_work_details', new_callable=AsyncMock) as mock_get:
-        from src.openalex_mcp.server import OpenAlex_get_work_details
-
-        mock_get.return_value = [MagicMock(text="Mock work details")]
-
-        result = await OpenAlex_get_work_details("W123456789")
-
-        assert result == "Mock work details"
-        mock_get.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_get_author_profile_tool():
-    """Test get_author_profile_tool function."""
-    with patch('src.openalex_mcp.server.get_author_profile', new_callable=AsyncMock) as mock_get:
-        from src.openalex_mcp.server import OpenAlex_get_author_profile
-
-        mock_get.return_value = [MagicMock(text="Mock author profile")]
-
-        result = await OpenAlex_get_author_profile("A123456789")
-
-        assert result == "Mock author profile"
-        mock_get.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_get_citations_tool():
-    """Test get_citations_tool function."""
-    with patch('src.openalex_mcp.server.get_citations', new_callable=AsyncMock) as mock_get:
-        from src.openalex_mcp.server import OpenAlex_get_citations
-
-        mock_get.return_value = [MagicMock(text="Mock citations")]
-
-        result = await OpenAlex_get_citations("W123456789", sort="cited_by_count")
-
-        assert result == "Mock citations"
-        mock_get.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_tool_with_exception():
+async def test_tool_with_exception(patch_tool):
     """Test tool behavior when underlying function raises exception."""
-    with patch('src.openalex_mcp.server.search_works', new_callable=AsyncMock) as mock_search:
-        from src.openalex_mcp.server import OpenAlex_search_works
-
-        mock_search.side_effect = Exception("Test error")
+    mock_search = patch_tool("search_works")
+    mock_search.side_effect = Exception("Test error")
 
-        # The tool doesn't handle exceptions - they bubble up
-        with pytest.raises(Exception, match="Test error"):
-            await OpenAlex_search_works("test query")
+    # The tool doesn't handle exceptions - they bubble up
+    with pytest.raises(Exception, match="Test error"):
+        await OpenAlex_search_works("test query")
 
-        mock_search.assert_awaited_once()
+    mock_search.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_tool_call_via_mcp():
+@pytest.mark.slow
+async def test_tool_call_via_mcp(mcp_server, patch_tool):
     """Test calling tools through the MCP interface."""
-    with patch('src.openalex_mcp.server.search_works', new_callable=AsyncMock) as mock_search:
-        # Mock successful response
-        mock_search.return_value = [MagicMock(text="Mock result")]
-
-        # Test that we can call tools through the FastMCP interface
-        result = await mcp.call_tool("OpenAlex_search_works", {"query": "test"})
-
-        # FastMCP returns a tuple: (content, structured_content)
-        assert isinstance(result, tuple)
-        assert len(result) == 2
-        content, structured = result
-        assert len(content) == 1
-        assert content[0].text == "Mock result"
+    mock_search = patch_tool("search_works")
+    # Mock successful response
+    mock_search.return_value = "Mock result"
+
+    # Test that we can call tools through the FastMCP interface
+    result = await mcp_server.call_tool("OpenAlex_search_works", {"query": "test"})
+
+    # FastMCP returns a tuple: (content, structured_content)
+    assert isinstance(result, tuple)
+    assert len(result) == 2
+    content, structured = result
+    assert len(content) == 1
+    assert content[0].text == "Mock result"
+
+
+def test_main_runs_stdio_server():
+    """Test that main() runs the stdio server, on uvloop when it is installed."""
+    find_spec = 'src.openalex_mcp.server.importlib.util.find_spec'
+    with patch('src.openalex_mcp.server.setup_logging'), \
+            patch(find_spec, return_value=object()), \
+            patch('src.openalex_mcp.server.sys.platform', "linux"), \
+            patch('src.openalex_mcp.server.anyio.run') as mock_run:
+        server.main()
+
+    mock_run.assert_called_once_with(
+        mcp.run_stdio_async, backend_options={"use_uvloop": True}
+    )
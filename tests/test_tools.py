@@ -1,11 +1,10 @@
 """Tests for the MCP tools."""
 
-from unittest.mock import AsyncMock
-
 import pytest
-from mcp.types import TextContent
 
 from src.openalex_mcp.tools import (
+    _normalize_author_id,
+    _normalize_work_id,
     download_paper,
     format_author_summary,
     format_institution_summary,
@@ -24,17 +23,51 @@ from src.openalex_mcp.tools import (
 class TestToolFormatters:
     """Test the data formatting functions."""
 
-    def test_format_work_summary(self, sample_work_data):
-        """Test work summary formatting."""
-        summary = format_work_summary(sample_work_data)
-
-        assert "Attention Is All You Need" in summary
-        assert "Ashish Vaswani" in summary
-        assert "2017" in summary
-        assert "15234" in summary  # citations
-        assert "arXiv (Cornell University)" in summary
-        assert "Machine Learning" in summary
-        assert "W2741809807" in summary
+    @pytest.mark.parametrize("formatter, fixture_name, needles", [
+        (format_work_summary, "sample_work_data", [
+            "Attention Is All You Need",
+            "Ashish Vaswani",
+            "2017",
+            "15234",  # citations
+            "arXiv (Cornell University)",
+            "Machine Learning",
+            "W2741809807",
+        ]),
+        (format_author_summary, "sample_author_data", [
+            "Ashish Vaswani",
+            "0000-0003-4890-3406",
+            "Google",
+            "45",  # works count
+            "25000",  # citations
+            "32",  # h-index
+            "Machine Learning",
+            "A2208157607",
+        ]),
+        (format_institution_summary, "sample_institution_data", [
+            "Stanford University",
+            "education",
+            "US",
+            "125000",  # works count
+            "15000000",  # citations
+            "00f54p054",  # ROR
+            "http://www.stanford.edu/",
+        ]),
+        (format_source_summary, "sample_source_data", [
+            "Nature",
+            "journal",
+            "Springer Nature",
+            "0028-0836",  # ISSN
+            "No",  # Open Access = False
+            "500000",  # works count
+            "S137773608",
+        ]),
+    ])
+    def test_format_summary(self, request, formatter, fixture_name, needles):
+        """Test that each summary formatter includes the entity's key fields."""
+        summary = formatter(request.getfixturevalue(fixture_name))
+
+        missing = [needle for needle in needles if needle not in summary]
+        assert not missing, f"missing from summary: {missing}"
 
     def test_format_work_summary_minimal_data(self):
         """Test work summary formatting with minimal data."""
@@ -56,52 +89,30 @@ class TestToolFormatters:
         assert "Unknown Venue" in summary
         assert "No topics" in summary
 
-    def test_format_author_summary(self, sample_author_data):
-        """Test author summary formatting."""
-        summary = format_author_summary(sample_author_data)
-
-        assert "Ashish Vaswani" in summary
-        assert "0000-0003-4890-3406" in summary
-        assert "Google" in summary
-        assert "45" in summary  # works count
-        assert "25000" in summary  # citations
-        assert "32" in summary  # h-index
-        assert "Machine Learning" in summary
-        assert "A2208157607" in summary
-
-    def test_format_institution_summary(self, sample_institution_data):
-        """Test institution summary formatting."""
-        summary = format_institution_summary(sample_institution_data)
-
-        assert "Stanford University" in summary
-        assert "education" in summary
-        assert "US" in summary
-        assert "125000" in summary  # works count
-        assert "15000000" in summary  # citations
-        assert "00f54p054" in summary  # ROR
-        assert "http://www.stanford.edu/" in summary
-
-    def test_format_source_summary(self, sample_source_data):
-        """Test source summary formatting."""
-        summary = format_source_summary(sample_source_data)
-
-        assert "Nature" in summary
-        assert "journal" in summary
-        assert "Springer Nature" in summary
-        assert "0028-0836" in summary  # ISSN
-        assert "No" in summary  # Open Access = False
-        assert "500000" in summary  # works count
-        assert "S137773608" in summary
+    def test_format_work_summary_many_authors(self):
+        """Test that only the first five named authors are listed."""
+        work = {
+            "title": "Big Collaboration",
+            "authorships": [{"author": None}] + [
+                {"author": {"display_name": f"Author {i}"}} for i in range(1, 8)
+            ],
+        }
+
+        summary = format_work_summary(work)
+
+        expected = "Authors: Author 1, Author 2, Author 3, Author 4, Author 5 et al.\n"
+        assert expected in summary
 
 
 class TestSearchTools:
     """Test the search tool functions."""
 
-    @pytest.mark.asyncio
-    async def test_search_works_success(self, mock_openalex_client, sample_work_data, sample_search_response):
+    async def test_search_works_success(
+        self, mock_openalex_client, sample_work_data, mutable_search_response
+    ):
         """Test successful work search."""
-        sample_search_response["results"] = [sample_work_data]
-        mock_openalex_client.get_works = AsyncMock(return_value=sample_search_response)
+        mutable_search_response["results"] = [sample_work_data]
+        mock_openalex_client.get_works.return_value = mutable_search_response
 
         arguments = {
             "query": "machine learning",
@@ -110,27 +121,21 @@ class TestSearchTools:
             "limit": 10
         }
 
-        results = await search_works(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert isinstance(results[0], TextContent)
-        assert "Attention Is All You Need" in results[0].text
-        assert "machine learning" in results[0].text
+        result = await search_works(mock_openalex_client, **arguments)
+        assert isinstance(result, str)
+        assert "Attention Is All You Need" in result
+        assert "machine learning" in result
 
         # Verify client was called with correct parameters
         mock_openalex_client.get_works.assert_called_once()
-        call_args = mock_openalex_client.get_works.call_args
-        assert call_args.kwargs["search"] == "machine learning"
-        assert call_args.kwargs["sort"] is None  # cited_by_count is filtered out for works
-        assert call_args.kwargs["per_page"] == 10
-
-    @pytest.mark.asyncio
-    async def test_search_works_with_filters(self, mock_openalex_client, sample_search_response):
-        """Test work search with filters."""
-        sample_search_response["results"] = []
-        mock_openalex_client.get_works = AsyncMock(return_value=sample_search_response)
-
-        arguments = {
+        # cited_by_count is filtered out for works
+        expected = {"search": "machine learning", "sort": None, "per_page": 10}
+        call_kwargs = mock_openalex_client.get_works.call_args.kwargs
+        assert expected.items() <= call_kwargs.items()
+
+    @pytest.mark.parametrize(
+        "tool, client_method, sample_name, arguments, expected_filters", [
+        (search_works, "get_works", "sample_work_data", {
             "query": "AI",
             "author": "John Doe",
             "venue": "Nature",
@@ -138,199 +143,142 @@ class TestSearchTools:
             "open_access": True,
             "year_from": 2020,
             "year_to": 2023
-        }
-
-        results = await search_works(mock_openalex_client, arguments)
-
-        # Check that filters were passed correctly
-        call_args = mock_openalex_client.get_works.call_args
-        filter_params = call_args.kwargs["filter_params"]
-
-        assert "raw_author_name.search" in filter_params
-        assert filter_params["raw_author_name.search"] == "John Doe"
-        assert "primary_location.source.display_name.search" in filter_params
-        assert filter_params["primary_location.source.display_name.search"] == "Nature"
-        assert "topics.display_name.search" in filter_params
-        assert filter_params["topics.display_name.search"] == "computer vision"
-        assert "is_oa" in filter_params
-        assert filter_params["is_oa"] == "true"
-
-    @pytest.mark.asyncio
-    async def test_search_works_no_results(self, mock_openalex_client, sample_search_response):
-        """Test work search with no results."""
-        sample_search_response["results"] = []
-        mock_openalex_client.get_works = AsyncMock(return_value=sample_search_response)
-
-        arguments = {"query": "nonexistent topic"}
-
-        results = await search_works(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "No works found" in results[0].text
-        assert "nonexistent topic" in results[0].text
-
-    @pytest.mark.asyncio
-    async def test_search_works_error(self, mock_openalex_client):
-        """Test work search with API error."""
-        mock_openalex_client.get_works = AsyncMock(side_effect=Exception("API Error"))
-
-        arguments = {"query": "test"}
-
-        results = await search_works(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "Error searching works" in results[0].text
-        assert "API Error" in results[0].text
-
-    @pytest.mark.asyncio
-    async def test_search_authors_success(self, mock_openalex_client, sample_author_data, sample_search_response):
-        """Test successful author search."""
-        sample_search_response["results"] = [sample_author_data]
-        mock_openalex_client.get_authors = AsyncMock(return_value=sample_search_response)
-
-        arguments = {
+        }, {
+            "raw_author_name.search": "John Doe",
+            "primary_location.source.display_name.search": "Nature",
+            "topics.display_name.search": "computer vision",
+            "is_oa": "true",
+            "from_publication_date": "2020-01-01",
+            "to_publication_date": "2023-12-31",
+        }),
+        (search_authors, "get_authors", "sample_author_data", {
             "query": "Ashish Vaswani",
             "institution": "Google",
             "h_index_min": 20
-        }
-
-        results = await search_authors(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "Ashish Vaswani" in results[0].text
-        assert "Google" in results[0].text
-
-        # Verify filters
-        call_args = mock_openalex_client.get_authors.call_args
-        filter_params = call_args.kwargs["filter_params"]
-        assert filter_params["last_known_institution.display_name.search"] == "Google"
-        assert filter_params["h_index"] == ">=20"
-
-    @pytest.mark.asyncio
-    async def test_search_institutions_success(self, mock_openalex_client, sample_institution_data, sample_search_response):
-        """Test successful institution search."""
-        sample_search_response["results"] = [sample_institution_data]
-        mock_openalex_client.get_institutions = AsyncMock(return_value=sample_search_response)
-
-        arguments = {
+        }, {
+            "last_known_institution.display_name.search": "Google",
+            "h_index": ">=20",
+        }),
+        (search_institutions, "get_institutions", "sample_institution_data", {
             "query": "Stanford",
             "country": "US",
-            "type": "education"
-        }
-
-        results = await search_institutions(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "Stanford University" in results[0].text
-
-        # Verify filters
-        call_args = mock_openalex_client.get_institutions.call_args
-        filter_params = call_args.kwargs["filter_params"]
-        assert filter_params["country_code"] == "US"
-        assert filter_params["type"] == "education"
-
-    @pytest.mark.asyncio
-    async def test_search_sources_success(self, mock_openalex_client, sample_source_data, sample_search_response):
-        """Test successful source search."""
-        sample_search_response["results"] = [sample_source_data]
-        mock_openalex_client.get_sources = AsyncMock(return_value=sample_search_response)
-
-        arguments = {
+            "institution_type": "education"
+        }, {
+            "country_code": "US",
+            "type": "education",
+        }),
+        # open_access=False means no is_oa filter should be added
+        (search_sources, "get_sources", "sample_source_data", {
             "query": "Nature",
-            "type": "journal",
+            "source_type": "journal",
             "open_access": False
-        }
+        }, {
+            "type": "journal",
+        }),
+    ])
+    async def test_search_with_filters(
+        self, request, mock_openalex_client, mutable_search_response,
+        tool, client_method, sample_name, arguments, expected_filters
+    ):
+        """Test that each search tool turns its arguments into API filters."""
+        mutable_search_response["results"] = [request.getfixturevalue(sample_name)]
+        get_entities = getattr(mock_openalex_client, client_method)
+        get_entities.return_value = mutable_search_response
+
+        result = await tool(mock_openalex_client, **arguments)
+        assert arguments["query"] in result
+
+        assert get_entities.call_args.kwargs["filter_params"] == expected_filters
+
+    async def test_search_works_no_results(
+        self, mock_openalex_client, sample_search_response
+    ):
+        """Test work search with no results."""
+        mock_openalex_client.get_works.return_value = sample_search_response
 
-        results = await search_sources(mock_openalex_client, arguments)
+        arguments = {"query": "nonexistent topic"}
 
-        assert len(results) == 1
-        assert "Nature" in results[0].text
+        result = await search_works(mock_openalex_client, **arguments)
+        assert "No works found" in result
+        assert "nonexistent topic" in result
 
-        # Verify filters
-        call_args = mock_openalex_client.get_sources.call_args
-        filter_params = call_args.kwargs["filter_params"]
-        assert filter_params["type"] == "journal"
-        # open_access=False means no filter should be added
-        assert "is_oa" not in filter_params
+    async def test_search_works_error(self, mock_openalex_client):
+        """Test work search with API error."""
+        mock_openalex_client.get_works.side_effect = Exception("API Error")
+
+        arguments = {"query": "test"}
 
+        result = await search_works(mock_openalex_client, **arguments)
+        assert "Error searching works" in result
+        assert "API Error" in result
 
 class TestDetailTools:
     """Test the detail retrieval tools."""
 
-    @pytest.mark.asyncio
     async def test_get_work_details_success(self, mock_openalex_client, sample_work_data):
         """Test successful work detail retrieval."""
-        mock_openalex_client.get_works = AsyncMock(return_value=sample_work_data)
+        mock_openalex_client.get_works.return_value = sample_work_data
 
         arguments = {"work_id": "W2741809807"}
 
-        results = await get_work_details(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "Attention Is All You Need" in results[0].text
-        assert "https://doi.org/10.48550/arxiv.1706.03762" in results[0].text
+        result = await get_work_details(mock_openalex_client, **arguments)
+        assert "Attention Is All You Need" in result
+        assert "https://doi.org/10.48550/arxiv.1706.03762" in result
 
         # Verify correct ID was used
         mock_openalex_client.get_works.assert_called_once_with(work_id="W2741809807")
 
-    @pytest.mark.asyncio
     async def test_get_work_details_doi_format(self, mock_openalex_client, sample_work_data):
         """Test work detail retrieval with DOI input."""
-        mock_openalex_client.get_works = AsyncMock(return_value=sample_work_data)
+        mock_openalex_client.get_works.return_value = sample_work_data
 
         arguments = {"work_id": "10.48550/arxiv.1706.03762"}
 
-        results = await get_work_details(mock_openalex_client, arguments)
+        result = await get_work_details(mock_openalex_client, **arguments)
 
         # Verify DOI was formatted correctly
         mock_openalex_client.get_works.assert_called_once_with(
             work_id="https://doi.org/10.48550/arxiv.1706.03762"
         )
 
-    @pytest.mark.asyncio
     async def test_get_work_details_not_found(self, mock_openalex_client):
         """Test work detail retrieval when work not found."""
-        mock_openalex_client.get_works = AsyncMock(return_value=None)
+        mock_openalex_client.get_works.return_value = None
 
         arguments = {"work_id": "W999999"}
 
-        results = await get_work_details(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "Work not found" in results[0].text
+        result = await get_work_details(mock_openalex_client, **arguments)
+        assert "Work not found" in result
 
-    @pytest.mark.asyncio
     async def test_get_author_profile_success(self, mock_openalex_client, sample_author_data):
         """Test successful author profile retrieval."""
-        mock_openalex_client.get_authors = AsyncMock(return_value=sample_author_data)
+        mock_openalex_client.get_authors.return_value = sample_author_data
 
         arguments = {"author_id": "A2208157607"}
 
-        results = await get_author_profile(mock_openalex_client, arguments)
+        result = await get_author_profile(mock_openalex_client, **arguments)
+        assert "Ashish Vaswani" in result
+        assert "Recent Publication Activity" in result
 
-        assert len(results) == 1
-        assert "Ashish Vaswani" in results[0].text
-        assert "Recent Publication Activity" in results[0].text
-
-    @pytest.mark.asyncio
     async def test_get_author_profile_orcid_format(self, mock_openalex_client, sample_author_data):
         """Test author profile retrieval with ORCID input."""
-        mock_openalex_client.get_authors = AsyncMock(return_value=sample_author_data)
+        mock_openalex_client.get_authors.return_value = sample_author_data
 
         arguments = {"author_id": "0000-0003-4890-3406"}
 
-        results = await get_author_profile(mock_openalex_client, arguments)
+        result = await get_author_profile(mock_openalex_client, **arguments)
 
         # Verify ORCID was formatted correctly
         mock_openalex_client.get_authors.assert_called_once_with(
             author_id="https://orcid.org/0000-0003-4890-3406"
         )
 
-    @pytest.mark.asyncio
-    async def test_get_citations_success(self, mock_openalex_client, sample_work_data, sample_search_response):
+    async def test_get_citations_success(
+        self, mock_openalex_client, sample_work_data, mutable_search_response
+    ):
         """Test successful citation retrieval."""
-        sample_search_response["results"] = [sample_work_data]
-        mock_openalex_client.get_works = AsyncMock(return_value=sample_search_response)
+        mutable_search_response["results"] = [sample_work_data]
+        mock_openalex_client.get_works.return_value = mutable_search_response
 
         arguments = {
             "work_id": "W2741809807",
@@ -338,53 +286,49 @@ class TestDetailTools:
             "limit": 10
         }
 
-        results = await get_citations(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "citing W2741809807" in results[0].text
+        result = await get_citations(mock_openalex_client, **arguments)
+        assert "citing W2741809807" in result
 
         # Verify filter was applied correctly
         call_args = mock_openalex_client.get_works.call_args
-        filter_params = call_args.kwargs["filter_params"]
-        assert filter_params["cites"] == "W2741809807"
+        assert call_args.kwargs["cites"] == "W2741809807"
 
-    @pytest.mark.asyncio
-    async def test_get_citations_no_results(self, mock_openalex_client, sample_search_response):
+    async def test_get_citations_no_results(
+        self, mock_openalex_client, sample_search_response
+    ):
         """Test citation retrieval with no results."""
-        sample_search_response["results"] = []
-        mock_openalex_client.get_works = AsyncMock(return_value=sample_search_response)
+        mock_openalex_client.get_works.return_value = sample_search_response
 
         arguments = {"work_id": "W999999"}
 
-        results = await get_citations(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "No citations found" in results[0].text
+        result = await get_citations(mock_openalex_client, **arguments)
+        assert "No citations found" in result
 
 
 class TestToolParameterHandling:
     """Test parameter handling in tools."""
 
-    @pytest.mark.asyncio
-    async def test_search_works_default_parameters(self, mock_openalex_client, sample_search_response):
+    async def test_search_works_default_parameters(
+        self, mock_openalex_client, sample_search_response
+    ):
         """Test search works with default parameters."""
-        sample_search_response["results"] = []
-        mock_openalex_client.get_works = AsyncMock(return_value=sample_search_response)
+        mock_openalex_client.get_works.return_value = sample_search_response
 
         # Only required parameter
         arguments = {"query": "test"}
 
-        await search_works(mock_openalex_client, arguments)
+        await search_works(mock_openalex_client, **arguments)
 
-        call_args = mock_openalex_client.get_works.call_args
-        assert call_args.kwargs["sort"] is None  # default (no sort for relevance)
-        assert call_args.kwargs["per_page"] == 10  # default limit
+        # No sort for relevance, and the default limit
+        expected = {"sort": None, "per_page": 10}
+        call_kwargs = mock_openalex_client.get_works.call_args.kwargs
+        assert expected.items() <= call_kwargs.items()
 
-    @pytest.mark.asyncio
-    async def test_search_works_year_range(self, mock_openalex_client, sample_search_response):
+    async def test_search_works_year_range(
+        self, mock_openalex_client, sample_search_response
+    ):
         """Test search works with year range filters."""
-        sample_search_response["results"] = []
-        mock_openalex_client.get_works = AsyncMock(return_value=sample_search_response)
+        mock_openalex_client.get_works.return_value = sample_search_response
 
         arguments = {
             "query": "test",
@@ -392,22 +336,47 @@ class TestToolParameterHandling:
             "year_to": 2023
         }
 
-        await search_works(mock_openalex_client, arguments)
+        await search_works(mock_openalex_client, **arguments)
 
-        call_args = mock_openalex_client.get_works.call_args
-        filter_params = call_args.kwargs["filter_params"]
+        filter_params = mock_openalex_client.get_works.call_args.kwargs["filter_params"]
 
         # Should use date range filters when both year_from and year_to are provided
-        assert "from_publication_date" in filter_params
-        assert "to_publication_date" in filter_params
+        expected = {
+            "from_publication_date": "2020-01-01",
+            "to_publication_date": "2023-12-31",
+        }
+        assert expected.items() <= filter_params.items()
+
+    async def test_search_works_year_from_only(
+        self, mock_openalex_client, sample_search_response
+    ):
+        """Test search works with only a start year, given as a string."""
+        mock_openalex_client.get_works.return_value = sample_search_response
+
+        await search_works(mock_openalex_client, query="test", year_from="2020")
+
+        filter_params = mock_openalex_client.get_works.call_args.kwargs["filter_params"]
         assert filter_params["from_publication_date"] == "2020-01-01"
-        assert filter_params["to_publication_date"] == "2023-12-31"
+        assert "to_publication_date" not in filter_params
+
+    def test_normalize_work_id(self):
+        """Test the accepted work ID formats."""
+        assert _normalize_work_id("https://openalex.org/W2741809807") == "W2741809807"
+        assert _normalize_work_id("10.48550/arxiv.1706.03762") == "https://doi.org/10.48550/arxiv.1706.03762"
+        assert _normalize_work_id("2741809807") == "W2741809807"
+        assert _normalize_work_id("W2741809807") == "W2741809807"
+
+    def test_normalize_author_id(self):
+        """Test the accepted author ID formats."""
+        assert _normalize_author_id("0000-0003-4890-3406") == "https://orcid.org/0000-0003-4890-3406"
+        assert _normalize_author_id("2208157607") == "A2208157607"
+        assert _normalize_author_id("A2208157607") == "A2208157607"
+        assert _normalize_author_id("https://openalex.org/A2208157607") == "https://openalex.org/A2208157607"
 
 
 class TestDownloadPaper:
     """Test the download_paper function."""
 
-    @pytest.mark.asyncio
     async def test_download_paper_success(self, mock_openalex_client, sample_work_data, tmp_path):
         """Test successful PDF download."""
         # Mock work data with PDF URL
@@ -417,7 +386,7 @@ class TestDownloadPaper:
             "pdf_url": "https://example.com/paper.pdf"
         }
 
-        mock_openalex_client.get_works = AsyncMock(return_value=work_with_pdf)
+        mock_openalex_client.get_works.return_value = work_with_pdf
 
         # Create a mock file for the test
         test_file_path = tmp_path / "test_paper.pdf"
@@ -427,9 +396,9 @@ class TestDownloadPaper:
             # Simulate successful download by writing to the file
             with open(path, "wb") as f:
                 f.write(b"fake pdf content")
-            return True
+            return len(b"fake pdf content")
 
-        mock_openalex_client.download_pdf = AsyncMock(side_effect=mock_download_pdf)
+        mock_openalex_client.download_pdf.side_effect = mock_download_pdf
 
         arguments = {
             "work_id": "W2741809807",
@@ -437,17 +406,14 @@ class TestDownloadPaper:
             "filename": "test_paper.pdf"
         }
 
-        results = await download_paper(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "Successfully downloaded" in results[0].text
-        assert "Attention Is All You Need" in results[0].text
-        assert str(tmp_path) in results[0].text
+        result = await download_paper(mock_openalex_client, **arguments)
+        assert "Successfully downloaded" in result
+        assert "Attention Is All You Need" in result
+        assert str(tmp_path) in result
 
         # Verify the download_pdf method was called
         mock_openalex_client.download_pdf.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_download_paper_no_pdf_available(self, mock_openalex_client, sample_work_data):
         """Test when no PDF is available."""
         # Mock work data without PDF
@@ -456,29 +422,23 @@ class TestDownloadPaper:
         work_without_pdf["best_oa_location"] = None
         work_without_pdf["locations"] = []
 
-        mock_openalex_client.get_works = AsyncMock(return_value=work_without_pdf)
+        mock_openalex_client.get_works.return_value = work_without_pdf
 
         arguments = {"work_id": "W2741809807"}
 
-        results = await download_paper(mock_openalex_client, arguments)
+        result = await download_paper(mock_openalex_client, **arguments)
+        assert "No open access PDF available" in result
+        assert "paywall" in result
 
-        assert len(results) == 1
-        assert "No open access PDF available" in results[0].text
-        assert "paywall" in results[0].text
-
-    @pytest.mark.asyncio
     async def test_download_paper_work_not_found(self, mock_openalex_client):
         """Test when work is not found."""
-        mock_openalex_client.get_works = AsyncMock(return_value=None)
+        mock_openalex_client.get_works.return_value = None
 
         arguments = {"work_id": "W9999999"}
 
-        results = await download_paper(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "Work not found" in results[0].text
+        result = await download_paper(mock_openalex_client, **arguments)
+        assert "Work not found" in result
 
-    @pytest.mark.asyncio
     async def test_download_paper_download_fails(self, mock_openalex_client, sample_work_data):
         """Test when PDF download fails."""
         # Mock work data with PDF URL
@@ -488,18 +448,15 @@ class TestDownloadPaper:
             "pdf_url": "https://example.com/paper.pdf"
         }
 
-        mock_openalex_client.get_works = AsyncMock(return_value=work_with_pdf)
-        mock_openalex_client.download_pdf = AsyncMock(return_value=False)
+        mock_openalex_client.get_works.return_value = work_with_pdf
+        mock_openalex_client.download_pdf.return_value = None
 
         arguments = {"work_id": "W2741809807"}
 
-        results = await download_paper(mock_openalex_client, arguments)
+        result = await download_paper(mock_openalex_client, **arguments)
+        assert "Failed to download PDF" in result
+        assert "Check logs for detailed error" in result
 
-        assert len(results) == 1
-        assert "Failed to download PDF" in results[0].text
-        assert "Check logs for detailed error" in results[0].text
-
-    @pytest.mark.asyncio
     async def test_download_paper_pdf_in_other_locations(self, mock_openalex_client, sample_work_data, tmp_path):
         """Test finding PDF in other locations when best_oa_location doesn't have it."""
         # Mock work data with PDF in other location
@@ -511,23 +468,40 @@ class TestDownloadPaper:
             {"is_oa": True, "pdf_url": "https://example.com/alt_paper.pdf"}
         ]
 
-        mock_openalex_client.get_works = AsyncMock(return_value=work_with_pdf)
+        mock_openalex_client.get_works.return_value = work_with_pdf
 
         async def mock_download_pdf(url, path):
             # Simulate successful download by writing to the file
             with open(path, "wb") as f:
                 f.write(b"fake pdf content")
-            return True
+            return len(b"fake pdf content")
 
-        mock_openalex_client.download_pdf = AsyncMock(side_effect=mock_download_pdf)
+        mock_openalex_client.download_pdf.side_effect = mock_download_pdf
 
         arguments = {"work_id": "W2741809807", "output_path": str(tmp_path)}
 
-        results = await download_paper(mock_openalex_client, arguments)
-
-        assert len(results) == 1
-        assert "Successfully downloaded" in results[0].text
+        result = await download_paper(mock_openalex_client, **arguments)
+        assert "Successfully downloaded" in result
 
         # Verify the correct URL was used
         call_args = mock_openalex_client.download_pdf.call_args
         assert call_args[0][0] == "https://example.com/alt_paper.pdf"
+
+    async def test_download_paper_generated_filename(
+        self, mock_openalex_client, sample_work_data, tmp_path
+    ):
+        """Test that generated filenames drop characters unsafe for filesystems."""
+        work_with_pdf = sample_work_data.copy()
+        work_with_pdf["title"] = 'Why "A/B" Tests: Fail?'
+        work_with_pdf["is_oa"] = True
+        work_with_pdf["best_oa_location"] = {"pdf_url": "https://example.com/paper.pdf"}
+
+        mock_openalex_client.get_works.return_value = work_with_pdf
+        mock_openalex_client.download_pdf.return_value = None
+
+        await download_paper(
+            mock_openalex_client, work_id="W2741809807", output_path=str(tmp_path)
+        )
+
+        file_path = mock_openalex_client.download_pdf.call_args[0][1]
+        assert file_path == str(tmp_path / "Why_AB_Tests_Fail.pdf")